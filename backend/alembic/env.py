@@ -7,7 +7,7 @@ from alembic import context
 
 # Import your Base and models
 from app.database import Base
-from app.models import User, Ticket, MagicLink
+from app.models import User, Ticket, TicketArchive, MagicLink, MagicLinkNonce, EmailOutbox, JobWatermark, TableVersion
 from app.config import settings
 
 # this is the Alembic Config object, which provides
@@ -18,8 +18,9 @@ config = context.config
 config.set_main_option('sqlalchemy.url', settings.DATABASE_URL)
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
+# This line sets up loggers basically. Skipped when the app runs migrations
+# on startup so uvicorn's logging is left alone.
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
@@ -63,6 +64,12 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # The app passes its own connection when migrating on startup
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -70,12 +77,19 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
+        do_run_migrations(connection)
+
+
+def do_run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite can't ALTER most things, batch mode recreates the table instead
+        render_as_batch=connection.dialect.name == "sqlite"
+    )
 
-        with context.begin_transaction():
-            context.run_migrations()
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 if context.is_offline_mode():
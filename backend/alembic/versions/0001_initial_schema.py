@@ -0,0 +1,90 @@
+"""Initial schema: users, tickets and magic links
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _id_type():
+    # Matches the models: native UUID on PostgreSQL, string elsewhere
+    if op.get_bind().dialect.name == "postgresql":
+        return postgresql.UUID(as_uuid=True)
+    return sa.String(36)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('id', _id_type(), nullable=False),
+        sa.Column('email', sa.String(255), nullable=False),
+        sa.Column('full_name', sa.String(255), nullable=False),
+        sa.Column('role', sa.String(20), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+
+    op.create_table(
+        'tickets',
+        sa.Column('id', _id_type(), nullable=False),
+        sa.Column('ticket_number', sa.String(100), nullable=False),
+        sa.Column('job_name', sa.String(255), nullable=False),
+        sa.Column('address', sa.Text(), nullable=False),
+        sa.Column('state', sa.String(2), nullable=False),
+        sa.Column('submit_date', sa.Date(), nullable=False),
+        sa.Column('expiration_date', sa.Date(), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('utility_responses', sa.Text(), nullable=True),
+        sa.Column('assigned_pm', sa.String(255), nullable=True),
+        sa.Column('created_by_id', _id_type(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('last_renewed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['created_by_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('ticket_number')
+    )
+    op.create_index('ix_tickets_state', 'tickets', ['state'])
+    op.create_index('ix_tickets_expiration_date', 'tickets', ['expiration_date'])
+    op.create_index('ix_tickets_status', 'tickets', ['status'])
+    op.create_index('ix_tickets_assigned_pm', 'tickets', ['assigned_pm'])
+
+    op.create_table(
+        'magic_links',
+        sa.Column('id', _id_type(), nullable=False),
+        sa.Column('user_id', _id_type(), nullable=False),
+        sa.Column('token', sa.String(255), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('used', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_magic_links_token', 'magic_links', ['token'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_magic_links_token', table_name='magic_links')
+    op.drop_table('magic_links')
+    op.drop_index('ix_tickets_assigned_pm', table_name='tickets')
+    op.drop_index('ix_tickets_status', table_name='tickets')
+    op.drop_index('ix_tickets_expiration_date', table_name='tickets')
+    op.drop_index('ix_tickets_state', table_name='tickets')
+    op.drop_table('tickets')
+    op.drop_index('ix_users_email', table_name='users')
+    op.drop_table('users')
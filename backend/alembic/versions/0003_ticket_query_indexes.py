@@ -0,0 +1,51 @@
+"""Composite and partial indexes for the hot ticket queries
+
+Query shapes covered (benchmarks/query_plans.py checks they use these):
+- status IN (...) AND expiration_date range: get_expiring_tickets and the
+  expiring-soon status update -> ix_tickets_status_expiration_date
+- assigned_pm = ? ORDER BY expiration_date, id: a PM's ticket list
+  -> ix_tickets_assigned_pm_expiration_date
+- expiration_date < today AND status != 'expired': the expire status update
+  -> ix_tickets_unexpired_expiration_date, which only holds open tickets
+
+The single-column status and assigned_pm indexes are leading prefixes of
+the new composites, so they are dropped.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 09:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tickets_status_expiration_date', 'tickets', ['status', 'expiration_date', 'id']
+    )
+    op.create_index(
+        'ix_tickets_assigned_pm_expiration_date', 'tickets', ['assigned_pm', 'expiration_date', 'id']
+    )
+    op.create_index(
+        'ix_tickets_unexpired_expiration_date', 'tickets', ['expiration_date'],
+        postgresql_where=sa.text("status != 'expired'"),
+        sqlite_where=sa.text("status != 'expired'")
+    )
+    op.drop_index('ix_tickets_status', table_name='tickets')
+    op.drop_index('ix_tickets_assigned_pm', table_name='tickets')
+
+
+def downgrade() -> None:
+    op.create_index('ix_tickets_assigned_pm', 'tickets', ['assigned_pm'])
+    op.create_index('ix_tickets_status', 'tickets', ['status'])
+    op.drop_index('ix_tickets_unexpired_expiration_date', table_name='tickets')
+    op.drop_index('ix_tickets_assigned_pm_expiration_date', table_name='tickets')
+    op.drop_index('ix_tickets_status_expiration_date', table_name='tickets')
@@ -0,0 +1,40 @@
+"""Job watermarks for incremental status transitions
+
+The status job now only looks at tickets whose expiration or warning
+boundary was crossed since its last run, found with ix_tickets_expiration_date,
+so the partial index on unexpired tickets it used before is dropped.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job_watermarks',
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('value', sa.Date(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('name')
+    )
+    op.drop_index('ix_tickets_unexpired_expiration_date', table_name='tickets')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_tickets_unexpired_expiration_date', 'tickets', ['expiration_date'],
+        postgresql_where=sa.text("status != 'expired'"),
+        sqlite_where=sa.text("status != 'expired'")
+    )
+    op.drop_table('job_watermarks')
@@ -0,0 +1,93 @@
+"""Row and table versions for ETags
+
+tickets.version is incremented by every UPDATE (see the model's onupdate)
+and identifies a ticket's representation. table_versions holds one
+counter per table, bumped by triggers on every INSERT, UPDATE and DELETE,
+so list endpoints can tell whether anything changed with a primary key
+lookup. PostgreSQL bumps once per statement; SQLite only has row-level
+triggers, so it bumps once per row.
+
+SQLite drops a table's triggers when a batch migration recreates it, so
+migrations that batch-alter tickets or users must recreate them.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+VERSIONED_TABLES = ('tickets', 'users')
+
+
+def create_version_triggers(table: str):
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(f"""
+            CREATE TRIGGER {table}_bump_table_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+        """)
+        return
+
+    for operation in ('INSERT', 'UPDATE', 'DELETE'):
+        op.execute(f"""
+            CREATE TRIGGER {table}_bump_table_version_{operation.lower()}
+            AFTER {operation} ON {table} BEGIN
+                UPDATE table_versions SET version = version + 1 WHERE name = '{table}';
+            END
+        """)
+
+
+def drop_version_triggers(table: str):
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_table_version ON {table}")
+        return
+
+    for operation in ('insert', 'update', 'delete'):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_table_version_{operation}")
+
+
+def upgrade() -> None:
+    op.add_column('tickets', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+    table_versions = op.create_table(
+        'table_versions',
+        sa.Column('name', sa.String(50), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+    op.bulk_insert(table_versions, [{'name': table, 'version': 1} for table in VERSIONED_TABLES])
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("""
+            CREATE FUNCTION bump_table_version() RETURNS trigger AS $$
+            BEGIN
+                UPDATE table_versions SET version = version + 1 WHERE name = TG_TABLE_NAME;
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+
+    for table in VERSIONED_TABLES:
+        create_version_triggers(table)
+
+
+def downgrade() -> None:
+    for table in VERSIONED_TABLES:
+        drop_version_triggers(table)
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP FUNCTION IF EXISTS bump_table_version()")
+
+    op.drop_table('table_versions')
+    # Native DROP COLUMN (SQLite 3.35+): a batch rebuild would renumber the
+    # rowids the search index refers to
+    op.drop_column('tickets', 'version')
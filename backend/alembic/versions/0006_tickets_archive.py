@@ -0,0 +1,61 @@
+"""Archive table for long-expired tickets
+
+The archive job moves tickets expired longer than ARCHIVE_RETENTION_DAYS
+from tickets into tickets_archive, keeping the hot table and its indexes
+small. Renewing an archived ticket moves it back.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def _id_type():
+    # Matches the models: native UUID on PostgreSQL, string elsewhere
+    if op.get_bind().dialect.name == "postgresql":
+        return postgresql.UUID(as_uuid=True)
+    return sa.String(36)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tickets_archive',
+        sa.Column('id', _id_type(), nullable=False),
+        sa.Column('ticket_number', sa.String(100), nullable=False),
+        sa.Column('job_name', sa.String(255), nullable=False),
+        sa.Column('address', sa.Text(), nullable=False),
+        sa.Column('state', sa.String(2), nullable=False),
+        sa.Column('submit_date', sa.Date(), nullable=False),
+        sa.Column('expiration_date', sa.Date(), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('utility_responses', sa.Text(), nullable=True),
+        sa.Column('assigned_pm', sa.String(255), nullable=True),
+        sa.Column('created_by_id', _id_type(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('last_renewed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tickets_archive_ticket_number', 'tickets_archive', ['ticket_number'])
+    op.create_index('ix_tickets_archive_expiration_date', 'tickets_archive', ['expiration_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tickets_archive_expiration_date', table_name='tickets_archive')
+    op.drop_index('ix_tickets_archive_ticket_number', table_name='tickets_archive')
+    op.drop_table('tickets_archive')
@@ -0,0 +1,35 @@
+"""Consumed nonces for signed magic links
+
+With MAGIC_LINK_SIGNED, magic links are HMAC-signed tokens that are not
+stored when issued. Using one inserts its nonce here, and the insert
+conflicting is what stops a link being used twice. The hourly purge job
+deletes nonces past their link's expiration, along with used or expired
+magic_links rows.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'magic_link_nonces',
+        sa.Column('nonce', sa.String(32), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('nonce')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('magic_link_nonces')
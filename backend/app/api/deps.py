@@ -2,26 +2,50 @@
 API dependencies for authentication and database access.
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from typing import Generator, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, Generator, Optional
 import jwt
-import uuid
-from app.database import get_db
+import time
+from app.database import AsyncSessionLocal, ReadSessionLocal, get_db
 from app.models.user import User
+from app.services.recent_writes import is_recent_writer, mark_recent_writer
+from app.utils.cache import TTLCache
 from app.utils.security import decode_access_token
 from app.config import settings
 
 security = HTTPBearer(auto_error=False)  # Don't auto-error if no token
 
+# Decoded JWT payloads by token, and active users by id, so authenticating
+# a request normally needs neither a signature check nor a database query
+token_cache = TTLCache(settings.USER_CACHE_MAX_SIZE, settings.USER_CACHE_TTL_SECONDS)
+user_cache = TTLCache(settings.USER_CACHE_MAX_SIZE, settings.USER_CACHE_TTL_SECONDS)
 
-def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+# Request methods that change data
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+USER_CACHE_FIELDS = ("id", "email", "full_name", "role", "is_active", "created_at", "updated_at")
+
+
+def invalidate_cached_user(user_id: str):
     """
-    Get the current authenticated user from JWT token.
+    Drop a user from the authentication cache after it changes.
+
+    Args:
+        user_id: User's unique identifier
+    """
+    user_cache.delete(str(user_id))
+
+
+async def _authenticate(credentials: Optional[HTTPAuthorizationCredentials], db: AsyncSession) -> User:
+    """
+    Get the user a JWT token belongs to.
+
+    Users are cached for USER_CACHE_TTL_SECONDS. Cache hits return a
+    transient User built from the cached columns, so callers must not rely
+    on it being attached to the request's session.
 
     TEMPORARY: If no token provided, return/create a test admin user for development.
 
@@ -40,49 +64,60 @@ def get_current_user(
         print("⚠️  AUTH BYPASS: No token provided, using test admin user")
 
         # Check if test user exists
-        test_user = db.query(User).filter(User.email == "test@admin.com").first()
+        result = await db.execute(select(User).filter(User.email == "test@admin.com"))
+        test_user = result.scalars().first()
 
         if not test_user:
             # Create test admin user
             test_user = User(
-                id=uuid.uuid4(),
                 email="test@admin.com",
                 full_name="Test Admin",
                 role="admin",
                 is_active=True
             )
             db.add(test_user)
-            db.commit()
-            db.refresh(test_user)
+            await db.commit()
+            await db.refresh(test_user)
             print("✅ Created test admin user: test@admin.com")
 
         return test_user
 
     # Normal authentication flow
     token = credentials.credentials
+    payload = token_cache.get(token)
 
-    try:
-        payload = decode_access_token(token)
-        user_id = payload.get("user_id")
-
-        if user_id is None:
+    if payload is None:
+        try:
+            payload = decode_access_token(token)
+        except jwt.ExpiredSignatureError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has expired"
+            )
+        except jwt.InvalidTokenError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials"
+                detail="Invalid token"
             )
 
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has expired"
-        )
-    except jwt.InvalidTokenError:
+        # Never keep a token cached past its own expiration
+        token_ttl = min(settings.USER_CACHE_TTL_SECONDS, payload.get("exp", 0) - time.time())
+        token_cache.set(token, payload, token_ttl)
+
+    user_id = payload.get("user_id")
+
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
+            detail="Invalid authentication credentials"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    cached_user = user_cache.get(user_id)
+    if cached_user is not None:
+        return User(**cached_user)
+
+    result = await db.execute(select(User).filter(User.id == user_id))
+    user = result.scalars().first()
 
     if user is None or not user.is_active:
         raise HTTPException(
@@ -90,9 +125,116 @@ def get_current_user(
             detail="User not found or inactive"
         )
 
+    user_cache.set(user_id, {field: getattr(user, field) for field in USER_CACHE_FIELDS})
+
     return user
 
 
+async def get_current_user(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """
+    Get the current authenticated user from JWT token.
+
+    Write requests (POST, PUT, PATCH, DELETE) mark the user as a recent
+    writer, from the start of the request until READ_REPLICA_LAG_SECONDS
+    after it (see services/recent_writes.py), so get_read_db sends their
+    reads to the primary.
+
+    Args:
+        request: Current request
+        credentials: HTTP Bearer credentials containing the JWT token
+        db: Database session
+
+    Returns:
+        User object
+
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    user = await _authenticate(credentials, db)
+
+    if request.method in WRITE_METHODS:
+        user_id = str(user.id)
+        await mark_recent_writer(user_id)
+        # Marked again by RecentWriterMiddleware once the response is sent
+        request.state.writer_id = user_id
+
+    return user
+
+
+async def get_read_db(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> AsyncIterator[AsyncSession]:
+    """
+    Get a database session for read-only endpoints.
+
+    Reads go to the DATABASE_READ_URL replica, except for users who made a
+    change in the last READ_REPLICA_LAG_SECONDS, who read from the primary.
+    Reads from the primary reuse the request's get_db session, so a request
+    never holds two pooled connections.
+
+    Args:
+        current_user: Authenticated user
+        db: Primary database session
+
+    Yields:
+        Database session
+    """
+    if not settings.DATABASE_READ_URL or await is_recent_writer(str(current_user.id)):
+        yield db
+        return
+
+    async with ReadSessionLocal() as read_db:
+        yield read_db
+
+
+async def get_streaming_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
+) -> User:
+    """
+    Get the current user for endpoints returning a StreamingResponse.
+
+    Dependencies that yield a session (get_db) only close it once the
+    response has been sent, so a long stream would hold a pooled
+    connection the whole time. This authenticates with a session that is
+    closed before the endpoint runs.
+
+    Args:
+        credentials: HTTP Bearer credentials containing the JWT token
+
+    Returns:
+        User object
+    """
+    async with AsyncSessionLocal() as db:
+        return await _authenticate(credentials, db)
+
+
+async def get_current_user_from_query(
+    access_token: Optional[str] = Query(None),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
+) -> User:
+    """
+    Get the current user from the Authorization header or an access_token
+    query parameter, for clients that cannot set headers (EventSource).
+    Like get_streaming_user, no database connection is held afterwards.
+
+    Args:
+        access_token: JWT token passed as ?access_token=
+        credentials: HTTP Bearer credentials, preferred when present
+
+    Returns:
+        User object
+    """
+    if credentials is None and access_token:
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=access_token)
+
+    return await get_streaming_user(credentials)
+
+
 def require_role(required_role: str):
     """
     Dependency factory to require a specific role or higher.
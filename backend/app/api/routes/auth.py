@@ -3,12 +3,14 @@ Authentication routes for magic link login.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models.user import User
 from app.schemas.auth import MagicLinkRequest, TokenResponse, UserInToken
 from app.services.auth_service import generate_magic_link, verify_magic_link, create_user_token
-from app.services.email_service import send_magic_link_email
+from app.services.email_service import render_magic_link_email
+from app.services.outbox_service import enqueue_email, notify_outbox
 from app.api.deps import get_current_user
 from app.config import settings
 
@@ -18,14 +20,15 @@ router = APIRouter()
 @router.post("/request-magic-link", status_code=status.HTTP_200_OK)
 async def request_magic_link(
     request: MagicLinkRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Request a magic link for passwordless login.
     Sends an email with a login link that expires in 15 minutes.
     """
     # Find user by email
-    user = db.query(User).filter(User.email == request.email).first()
+    result = await db.execute(select(User).filter(User.email == request.email))
+    user = result.scalars().first()
 
     if not user:
         raise HTTPException(
@@ -40,13 +43,16 @@ async def request_magic_link(
         )
 
     # Generate magic link token
-    token = generate_magic_link(str(user.id), db)
+    token = await generate_magic_link(str(user.id), db)
 
     # Construct magic link URL
     magic_link_url = f"{settings.FRONTEND_URL}/verify?token={token}"
 
-    # Send email
-    await send_magic_link_email(user.email, magic_link_url)
+    # Queue email, the outbox worker sends it
+    subject, html_body = render_magic_link_email(magic_link_url)
+    enqueue_email(db, to=user.email, subject=subject, html_body=html_body)
+    await db.commit()
+    notify_outbox()
 
     return {
         "message": "Magic link sent to your email",
@@ -57,13 +63,13 @@ async def request_magic_link(
 @router.get("/verify-magic-link", response_model=TokenResponse)
 async def verify_magic_link_route(
     token: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Verify a magic link token and return a JWT access token.
     """
     # Verify magic link
-    user = verify_magic_link(token, db)
+    user = await verify_magic_link(token, db)
 
     if not user:
         raise HTTPException(
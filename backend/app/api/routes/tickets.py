@@ -2,27 +2,344 @@
 Ticket routes for CRUD operations.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, func, literal, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from typing import Optional
 from datetime import datetime, date
-from app.database import get_db
+from app.database import get_db, async_engine, is_replica_session
 from app.models.ticket import Ticket
+from app.models.ticket_archive import TicketArchive
 from app.models.user import User
 from app.schemas.ticket import (
     TicketCreate, TicketUpdate, TicketResponse, TicketListResponse,
-    TicketRenew, TicketStats
+    TicketRenew, TicketStats, TicketCount, TicketImportResponse,
+    TicketBulkSelection, TicketBulkRenew, TicketBulkUpdate, TicketBulkResult, TicketBulkResponse
+)
+from app.api.deps import get_current_user, get_current_user_from_query, get_read_db, get_streaming_user, require_role
+from app.services import stats_service
+from app.services.archive_service import ArchiveConflict, restore_archived_ticket, restore_archived_tickets
+from app.services.event_hub import event_hub, publish_ticket_batch, stream_ticket_events, ticket_event_data
+from app.services.export_service import (
+    ARCHIVE_EXPORT_COLUMNS, EXPORT_COLUMNS, EXPORT_FIELDS, MEDIA_TYPES, stream_tickets
+)
+from app.services.import_service import import_tickets, iter_csv_rows, iter_ndjson_rows
+from app.services.response_cache import cache_response, get_cached_response, invalidate_ticket_responses
+from app.services.search_service import apply_search, search_filter
+from app.services.stats_service import ticket_snapshot, record_ticket_change, invalidate_ticket_stats
+from app.services import ticket_rows
+from app.services.ticket_rows import (
+    JSON_MEDIA_TYPE, LIST_FORMATS, MSGPACK_ACCEPT, MSGPACK_MEDIA_TYPE,
+    encode_ticket_list, ticket_row_dict, ticket_rows_query
+)
+from app.services.ticket_service import (
+    bulk_update_tickets, calculate_ticket_expiration, current_status_expression, normalise_ticket_id,
+    valid_ticket_ids
+)
+from app.utils.compression import VARY, compress_body, encoded_etag, negotiate_encoding, prefers
+from app.utils.etag import (
+    etag_matches, etag_response, get_table_versions, make_etag, not_modified, set_etag, table_version
 )
-from app.api.deps import get_current_user, require_role
-from app.services.ticket_service import calculate_ticket_expiration
 from app.utils.expiration import determine_status
+from app.utils.pagination import encode_cursor, decode_cursor, keyset_filter, keyset_order_by
+from app.config import settings
 
 router = APIRouter()
 
 
+async def _get_ticket_or_404(db: AsyncSession, ticket_id) -> Ticket:
+    """
+    Load a ticket with its creator in one query, or raise 404 if it does
+    not exist.
+    """
+    result = await db.execute(
+        select(Ticket)
+        .options(joinedload(Ticket.created_by))
+        .filter(Ticket.id == ticket_id)
+        .execution_options(populate_existing=True)
+    )
+    ticket = result.scalars().first()
+
+    if not ticket:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found"
+        )
+
+    return ticket
+
+
+def _filter_tickets(
+    query,
+    dialect_name: str,
+    status_filter: Optional[str] = None,
+    state: Optional[str] = None,
+    assigned_pm: Optional[str] = None,
+    search: Optional[str] = None,
+    model=Ticket
+):
+    """
+    Apply the list_tickets filters to a select() over Ticket (or
+    TicketArchive, which is searched without an index).
+
+    Returns the filtered query and, when searching tickets, an ORDER BY
+    clause that ranks the best matches first (None otherwise).
+    """
+    relevance = None
+    if status_filter:
+        query = query.filter(model.status == status_filter)
+
+    if state:
+        query = query.filter(model.state == state)
+
+    if assigned_pm:
+        query = query.filter(model.assigned_pm == assigned_pm)
+
+    if search:
+        if model is Ticket:
+            query, relevance = apply_search(query, search, dialect_name)
+        else:
+            query = query.filter(search_filter(model, search))
+
+    return query, relevance
+
+
+def _union_with_archive(columns, dialect_name: str, *filters):
+    """
+    UNION ALL of the same columns selected from tickets and tickets_archive
+    with the list_tickets filters applied to each, as a subquery.
+
+    Args:
+        columns: Function returning the columns to select from a model
+        dialect_name: Database dialect the query will run on
+        filters: status_filter, state, assigned_pm, search
+
+    Returns:
+        Subquery whose columns are named like the selected columns
+    """
+    return union_all(*[
+        _filter_tickets(select(*columns(model)), dialect_name, *filters, model=model)[0]
+        for model in (Ticket, TicketArchive)
+    ]).subquery()
+
+
+def _relevance_with_archive_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Relevance sorting is not available with include_archived"
+    )
+
+
+async def _list_ticket_page(
+    db: AsyncSession,
+    status_filter: Optional[str],
+    state: Optional[str],
+    assigned_pm: Optional[str],
+    search: Optional[str],
+    sort_by: str,
+    sort_order: str,
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+    include_total: bool,
+    include_archived: bool = False,
+    list_format: str = "rows",
+    media_type: str = JSON_MEDIA_TYPE
+) -> bytes:
+    """
+    Query one page of tickets for list_tickets and serialize it.
+
+    With TICKET_LIST_FAST_PATH, and always for the columnar format or
+    MessagePack, the page is read as plain rows and encoded directly (see
+    services/ticket_rows.py) instead of through ORM objects and
+    TicketListResponse.
+    """
+    dialect_name = db.bind.dialect.name
+    default_encoding = (list_format, media_type) == ("rows", JSON_MEDIA_TYPE)
+    from_rows = settings.TICKET_LIST_FAST_PATH or not default_encoding
+
+    if include_archived:
+        page = await _list_ticket_page_with_archive(
+            db, status_filter, state, assigned_pm, search,
+            sort_by, sort_order, skip, limit, cursor, include_total
+        )
+        if default_encoding:
+            return page.model_dump_json().encode()
+        return encode_ticket_list(**page.model_dump(mode="json"), list_format=list_format, media_type=media_type)
+
+    # Start with base query
+    query, relevance = _filter_tickets(
+        select(Ticket), dialect_name, status_filter, state, assigned_pm, search
+    )
+
+    # Get total count before pagination
+    total = None
+    if include_total:
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
+
+    if sort_by == "relevance" and relevance is not None:
+        if cursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination is not available for relevance sorting"
+            )
+        query = query.order_by(relevance, Ticket.id).offset(skip).limit(limit)
+
+        if from_rows:
+            result = await db.execute(ticket_rows_query(query))
+            return encode_ticket_list(
+                [ticket_row_dict(row) for row in result], total, skip, limit,
+                list_format=list_format, media_type=media_type
+            )
+
+        result = await db.execute(query.options(joinedload(Ticket.created_by)))
+        return TicketListResponse(
+            tickets=result.scalars().all(),
+            total=total,
+            skip=skip,
+            limit=limit
+        ).model_dump_json().encode()
+
+    # Apply sorting (Ticket.id breaks ties so pages are stable)
+    if sort_by not in Ticket.__table__.columns:
+        sort_by = "expiration_date"
+    sort_column = getattr(Ticket, sort_by)
+    descending = sort_order == "desc"
+    query = query.order_by(*keyset_order_by(sort_column, Ticket.id, descending))
+
+    # Apply pagination
+    if cursor:
+        try:
+            last_value, last_id = decode_cursor(
+                cursor, sort_column, sort_order, dialect_name
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        query = query.filter(keyset_filter(sort_column, Ticket.id, last_value, last_id, descending))
+    else:
+        query = query.offset(skip)
+
+    # Fetch one extra row to know whether another page exists
+    query = query.limit(limit + 1)
+
+    if from_rows:
+        result = await db.execute(ticket_rows_query(query, sort_column.label("sort_value")))
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(sort_column.key, sort_order, rows[-1].sort_value, rows[-1].id)
+
+        return encode_ticket_list(
+            [ticket_row_dict(row) for row in rows], total, skip, limit, next_cursor,
+            list_format=list_format, media_type=media_type
+        )
+
+    result = await db.execute(query.options(joinedload(Ticket.created_by)))
+    tickets = result.scalars().all()
+
+    next_cursor = None
+    if len(tickets) > limit:
+        tickets = tickets[:limit]
+        last = tickets[-1]
+        next_cursor = encode_cursor(sort_column.key, sort_order, getattr(last, sort_column.key), last.id)
+
+    return TicketListResponse(
+        tickets=tickets,
+        total=total,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor
+    ).model_dump_json().encode()
+
+
+async def _list_ticket_page_with_archive(
+    db: AsyncSession,
+    status_filter: Optional[str],
+    state: Optional[str],
+    assigned_pm: Optional[str],
+    search: Optional[str],
+    sort_by: str,
+    sort_order: str,
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+    include_total: bool
+) -> TicketListResponse:
+    """
+    Query one page of tickets and archived tickets for list_tickets.
+
+    The page is chosen from the ids and sort values of both tables in one
+    UNION ALL query, then its rows are loaded from each table by id.
+    """
+    dialect_name = db.bind.dialect.name
+    filters = (status_filter, state, assigned_pm, search)
+
+    if sort_by not in Ticket.__table__.columns:
+        raise _relevance_with_archive_error()
+
+    rows = _union_with_archive(
+        lambda model: [model.id, getattr(model, sort_by).label("sort_value"),
+                       literal(model is TicketArchive).label("archived")],
+        dialect_name, *filters
+    )
+
+    total = None
+    if include_total:
+        total = await db.scalar(select(func.count()).select_from(rows))
+
+    descending = sort_order == "desc"
+    query = select(rows).order_by(*keyset_order_by(rows.c.sort_value, rows.c.id, descending))
+
+    if cursor:
+        try:
+            last_value, last_id = decode_cursor(
+                cursor, getattr(Ticket, sort_by), sort_order, dialect_name
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        query = query.filter(keyset_filter(rows.c.sort_value, rows.c.id, last_value, last_id, descending))
+    else:
+        query = query.offset(skip)
+
+    # Fetch one extra row to know whether another page exists
+    page = (await db.execute(query.limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = encode_cursor(sort_by, sort_order, page[-1].sort_value, page[-1].id)
+
+    loaded = {}
+    for model, archived in ((Ticket, False), (TicketArchive, True)):
+        ids = [row.id for row in page if bool(row.archived) == archived]
+        if ids:
+            result = await db.execute(
+                select(model).options(joinedload(model.created_by)).filter(model.id.in_(ids))
+            )
+            loaded.update((str(ticket.id), ticket) for ticket in result.scalars())
+
+    return TicketListResponse(
+        tickets=[loaded[str(row.id)] for row in page if str(row.id) in loaded],
+        total=total,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor
+    )
+
+
 @router.get("", response_model=TicketListResponse)
 async def list_tickets(
+    request: Request,
     status_filter: Optional[str] = Query(None, alias="status"),
     state: Optional[str] = None,
     assigned_pm: Optional[str] = None,
@@ -31,115 +348,256 @@ async def list_tickets(
     sort_order: str = "asc",
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    include_archived: bool = False,
+    list_format: str = Query("rows", alias="format"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List all tickets with optional filtering and sorting.
+
+    Pass the next_cursor from a previous page as `cursor` to fetch the
+    following page by keyset instead of skip/offset, and include_total=false
+    to skip the count query (use GET /tickets/count for it instead).
+    With a search, sort_by=relevance ranks the best matches first (skip/limit
+    paging only). include_archived=true also lists tickets the archive job
+    has moved to tickets_archive (they have archived_at set).
+
+    format=columnar returns {columns, dictionaries, total, skip, limit,
+    next_cursor}: one array per ticket field, in ticket order, where
+    state, status, assigned_pm and created_by hold indexes into
+    dictionaries[field] (or null). Send Accept: application/msgpack for
+    MessagePack instead of JSON (if msgpack is installed). Large bodies
+    are compressed with brotli or gzip as Accept-Encoding allows.
+
+    Pages are served from the response cache until a ticket or user
+    changes. Answers 304 Not Modified when If-None-Match has the current
+    ETag, which changes with any write to tickets or users.
     """
-    # Start with base query
-    query = db.query(Ticket)
+    if sort_by not in Ticket.__table__.columns and not (sort_by == "relevance" and search):
+        sort_by = "expiration_date"
 
-    # Apply filters
-    if status_filter:
-        query = query.filter(Ticket.status == status_filter)
+    if list_format not in LIST_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported list format. Use format=rows or format=columnar"
+        )
 
-    if state:
-        query = query.filter(Ticket.state == state)
+    media_type = JSON_MEDIA_TYPE
+    if ticket_rows.msgpack is not None and prefers(request.headers.get("accept"), MSGPACK_ACCEPT, JSON_MEDIA_TYPE):
+        media_type = MSGPACK_MEDIA_TYPE
+
+    params = {
+        "status_filter": status_filter, "state": state, "assigned_pm": assigned_pm, "search": search,
+        "sort_by": sort_by, "sort_order": sort_order, "skip": skip, "limit": limit,
+        "cursor": cursor, "include_total": include_total, "include_archived": include_archived,
+        "list_format": list_format, "media_type": media_type
+    }
+
+    etag, body, cache_key = await get_cached_response("list_tickets", params)
+    if body is None:
+        versions = await get_table_versions(db, "tickets", "users")
+        etag = make_etag("tickets", versions["tickets"], versions["users"], sorted(params.items()))
+
+    # Bodies are cached uncompressed, each coding gets its own ETag. Bodies
+    # too small to compress are sent with the plain ETag, so the client may
+    # hold either one
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    for candidate in dict.fromkeys((encoded_etag(etag, encoding), etag)):
+        if etag_matches(request, candidate):
+            response = not_modified(candidate)
+            response.headers["Vary"] = VARY
+            return response
+
+    if body is None:
+        body = await _list_ticket_page(db, **params)
+        await cache_response(cache_key, etag, body, from_replica=is_replica_session(db))
+
+    body, content_encoding = compress_body(body, encoding)
+    response = etag_response(body, encoded_etag(etag, content_encoding), media_type=media_type)
+    response.headers["Vary"] = VARY
+    if content_encoding:
+        response.headers["Content-Encoding"] = content_encoding
+    return response
+
+
+@router.get("/count", response_model=TicketCount)
+async def count_tickets(
+    status_filter: Optional[str] = Query(None, alias="status"),
+    state: Optional[str] = None,
+    assigned_pm: Optional[str] = None,
+    search: Optional[str] = None,
+    include_archived: bool = False,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Count tickets matching the same filters as list_tickets.
+    """
+    filters = (status_filter, state, assigned_pm, search)
 
-    if assigned_pm:
-        query = query.filter(Ticket.assigned_pm == assigned_pm)
+    if include_archived:
+        query = _union_with_archive(lambda model: [model.id], db.bind.dialect.name, *filters)
+    else:
+        query = _filter_tickets(select(Ticket.id), db.bind.dialect.name, *filters)[0].subquery()
+    total = await db.scalar(select(func.count()).select_from(query))
 
-    if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            or_(
-                Ticket.ticket_number.ilike(search_pattern),
-                Ticket.job_name.ilike(search_pattern),
-                Ticket.address.ilike(search_pattern)
-            )
+    return TicketCount(total=total)
+
+
+@router.get("/export")
+async def export_tickets(
+    status_filter: Optional[str] = Query(None, alias="status"),
+    state: Optional[str] = None,
+    assigned_pm: Optional[str] = None,
+    search: Optional[str] = None,
+    sort_by: str = "expiration_date",
+    sort_order: str = "asc",
+    file_format: str = Query("csv", alias="format"),
+    include_archived: bool = False,
+    current_user: User = Depends(get_streaming_user)
+):
+    """
+    Export all tickets matching the list_tickets filters as CSV or NDJSON.
+
+    The response is streamed from a server-side cursor, so large exports
+    start immediately and use constant memory. include_archived=true also
+    exports archived tickets.
+    """
+    if file_format not in MEDIA_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported export format. Use format=csv or format=ndjson"
         )
 
-    # Get total count before pagination
-    total = query.count()
+    filters = (status_filter, state, assigned_pm, search)
+
+    if include_archived:
+        if sort_by == "relevance" and search:
+            raise _relevance_with_archive_error()
+        if sort_by not in EXPORT_FIELDS:
+            sort_by = "expiration_date"
 
-    # Apply sorting
-    sort_column = getattr(Ticket, sort_by, Ticket.expiration_date)
-    if sort_order == "desc":
-        query = query.order_by(sort_column.desc())
+        rows = _union_with_archive(
+            lambda model: EXPORT_COLUMNS if model is Ticket else ARCHIVE_EXPORT_COLUMNS,
+            async_engine.dialect.name, *filters
+        )
+        query = select(rows).order_by(*keyset_order_by(rows.c[sort_by], rows.c.id, sort_order == "desc"))
     else:
-        query = query.order_by(sort_column.asc())
+        query, relevance = _filter_tickets(select(*EXPORT_COLUMNS), async_engine.dialect.name, *filters)
 
-    # Apply pagination
-    tickets = query.offset(skip).limit(limit).all()
+        if sort_by == "relevance" and relevance is not None:
+            query = query.order_by(relevance, Ticket.id)
+        else:
+            if sort_by not in Ticket.__table__.columns:
+                sort_by = "expiration_date"
+            query = query.order_by(*keyset_order_by(getattr(Ticket, sort_by), Ticket.id, sort_order == "desc"))
 
-    return TicketListResponse(
-        tickets=tickets,
-        total=total,
-        skip=skip,
-        limit=limit
+    filename = f"tickets-{date.today().isoformat()}.{file_format}"
+
+    return StreamingResponse(
+        stream_tickets(query, file_format),
+        media_type=MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/events")
+async def ticket_events(
+    request: Request,
+    last_event_id: Optional[str] = None,
+    current_user: User = Depends(get_current_user_from_query)
+):
+    """
+    Stream ticket changes as server-sent events.
+
+    Events: created, updated, renewed, deleted (data: the ticket's id,
+    ticket_number, status, expiration_date and assigned_pm), imported
+    (created and updated counts), and status_changed, bulk_renewed,
+    bulk_updated and archived (count, and the tickets if there are at most 100).
+    "reset" means events were missed and everything should be refetched.
+
+    Browsers resume with the Last-Event-ID header on reconnect; other
+    clients can pass ?last_event_id=. EventSource cannot set headers, so
+    the token may be passed as ?access_token=.
+    """
+    resume_from = request.headers.get("last-event-id") or last_event_id
+
+    return StreamingResponse(
+        stream_ticket_events(resume_from),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 
 @router.get("/stats", response_model=TicketStats)
 async def get_ticket_stats(
+    request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get aggregate statistics about tickets.
+
+    The ETag follows the tickets table version, like the ticket list's, so
+    it is the same from every worker and 304 Not Modified is answered
+    until a ticket changes (or the day, which moves the 7-day window).
     """
-    # Count tickets by status
-    total_tickets = db.query(Ticket).count()
-    active_tickets = db.query(Ticket).filter(Ticket.status == "active").count()
-    expiring_soon_tickets = db.query(Ticket).filter(Ticket.status == "expiring_soon").count()
-    expired_tickets = db.query(Ticket).filter(Ticket.status == "expired").count()
-    renewed_tickets = db.query(Ticket).filter(Ticket.status == "renewed").count()
-
-    # Count tickets by state
-    state_counts = db.query(
-        Ticket.state,
-        func.count(Ticket.id)
-    ).group_by(Ticket.state).all()
-
-    tickets_by_state = {state: count for state, count in state_counts}
-
-    # Count expiring in next 7 days
-    from datetime import timedelta
-    today = date.today()
-    next_week = today + timedelta(days=7)
-    expiring_in_next_7_days = db.query(Ticket).filter(
-        Ticket.expiration_date >= today,
-        Ticket.expiration_date <= next_week
-    ).count()
-
-    return TicketStats(
-        total_tickets=total_tickets,
-        active_tickets=active_tickets,
-        expiring_soon_tickets=expiring_soon_tickets,
-        expired_tickets=expired_tickets,
-        renewed_tickets=renewed_tickets,
-        tickets_by_state=tickets_by_state,
-        expiring_in_next_7_days=expiring_in_next_7_days
-    )
+    etag, body, cache_key = await get_cached_response("ticket_stats", {})
+
+    if body is None:
+        versions = await get_table_versions(db, "tickets")
+        etag = make_etag("stats", versions["tickets"], date.today())
+
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    if body is None:
+        stats = await stats_service.get_ticket_stats(db, versions["tickets"])
+        body = stats.model_dump_json().encode()
+        await cache_response(cache_key, etag, body, from_replica=is_replica_session(db))
+
+    return etag_response(body, etag)
 
 
 @router.get("/{ticket_id}", response_model=TicketResponse)
 async def get_ticket(
     ticket_id: str,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a single ticket by ID.
+
+    Answers 304 Not Modified when If-None-Match has the current ETag,
+    which changes when the ticket (or any user, for created_by) does.
+    Archived tickets are returned too, with archived_at set.
     """
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    result = await db.execute(
+        select(Ticket.version, table_version("users")).filter(Ticket.id == ticket_id)
+    )
+    row = result.first()
 
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
+    if row is not None:
+        etag = make_etag("ticket", ticket_id, *row)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+    else:
+        result = await db.execute(
+            select(TicketArchive)
+            .options(joinedload(TicketArchive.created_by))
+            .filter(TicketArchive.id == ticket_id)
         )
+        archived = result.scalars().first()
+        if archived:
+            return archived
+
+    ticket = await _get_ticket_or_404(db, ticket_id)
 
     return ticket
 
@@ -148,16 +606,20 @@ async def get_ticket(
 async def create_ticket(
     ticket_data: TicketCreate,
     current_user: User = Depends(require_role("editor")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new ticket.
     Requires editor or admin role.
     """
-    # Check if ticket number already exists
-    existing_ticket = db.query(Ticket).filter(
-        Ticket.ticket_number == ticket_data.ticket_number
-    ).first()
+    # Check if ticket number already exists, including archived tickets
+    result = await db.execute(
+        select(Ticket.id).filter(Ticket.ticket_number == ticket_data.ticket_number)
+        .union_all(
+            select(TicketArchive.id).filter(TicketArchive.ticket_number == ticket_data.ticket_number)
+        )
+    )
+    existing_ticket = result.first()
 
     if existing_ticket:
         raise HTTPException(
@@ -187,14 +649,173 @@ async def create_ticket(
         utility_responses=ticket_data.utility_responses,
         assigned_pm=ticket_data.assigned_pm,
         notes=ticket_data.notes,
-        created_by_id=str(current_user.id)
+        created_by_id=str(current_user.id),
+        updated_at=None  # Loaded up front, saves eager_defaults a SELECT after the INSERT
     )
 
     db.add(ticket)
-    db.commit()
-    db.refresh(ticket)
+    await db.commit()
+    record_ticket_change(after=ticket_snapshot(ticket))
+    await invalidate_ticket_responses()
+    event_hub.publish("created", ticket_event_data(ticket))
 
-    return ticket
+    return await _get_ticket_or_404(db, ticket.id)
+
+
+@router.post("/import", response_model=TicketImportResponse)
+async def import_tickets_route(
+    file: UploadFile = File(...),
+    file_format: Optional[str] = Query(None, alias="format"),
+    update_existing: bool = False,
+    current_user: User = Depends(require_role("editor")),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Bulk import tickets from a CSV or NDJSON file.
+    Requires editor or admin role.
+
+    CSV files need a header row with TicketCreate field names. The format is
+    taken from ?format=csv|ndjson, or else the file name / content type.
+    Tickets whose number already exists are reported as errors unless
+    update_existing=true, in which case they are updated.
+    """
+    if file_format is None:
+        filename = (file.filename or "").lower()
+        content_type = file.content_type or ""
+        if filename.endswith((".ndjson", ".jsonl")) or "ndjson" in content_type:
+            file_format = "ndjson"
+        elif filename.endswith(".csv") or "csv" in content_type:
+            file_format = "csv"
+
+    if file_format == "csv":
+        rows = iter_csv_rows(file.file)
+    elif file_format == "ndjson":
+        rows = iter_ndjson_rows(file.file)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported file format. Use format=csv or format=ndjson"
+        )
+
+    try:
+        return await import_tickets(db, rows, str(current_user.id), update_existing)
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be UTF-8 encoded"
+        )
+
+
+async def _bulk_change(
+    db: AsyncSession,
+    selection: TicketBulkSelection,
+    values: dict,
+    event_type: str,
+    restore_archived: bool = False
+) -> TicketBulkResponse:
+    """
+    Apply values to the selected tickets in one UPDATE and transaction,
+    then report the result for each ticket.
+
+    With restore_archived, archived tickets selected by id are moved back
+    into tickets first, in the same transaction.
+    """
+    conflicts = []
+    if restore_archived and selection.ids is not None:
+        _, conflicts = await restore_archived_tickets(db, valid_ticket_ids(selection.ids))
+
+    filters = selection.filter.model_dump(exclude_none=True) if selection.filter else None
+    rows = await bulk_update_tickets(db, values, ids=selection.ids, filters=filters)
+    await db.commit()
+
+    results = [
+        TicketBulkResult(
+            id=str(row.id), result="updated", ticket_number=row.ticket_number,
+            status=row.status, expiration_date=row.expiration_date
+        )
+        for row in rows
+    ]
+
+    if selection.ids is not None:
+        updated_ids = {result.id for result in results}
+        conflict_ids = set(conflicts)
+        # The same ticket may be given in several forms (case, hyphens, braces)
+        requested = {}
+        for ticket_id in selection.ids:
+            requested.setdefault(normalise_ticket_id(ticket_id), ticket_id)
+        results += [
+            TicketBulkResult(id=ticket_id, result="conflict" if normalised in conflict_ids else "not_found")
+            for normalised, ticket_id in requested.items()
+            if normalised not in updated_ids
+        ]
+
+    if rows:
+        invalidate_ticket_stats()
+        await invalidate_ticket_responses()
+        publish_ticket_batch(event_type, [
+            {"id": result.id, "ticket_number": result.ticket_number, "status": result.status}
+            for result in results if result.result == "updated"
+        ])
+
+    return TicketBulkResponse(
+        updated=len(rows),
+        not_found=sum(result.result == "not_found" for result in results),
+        conflicts=sum(result.result == "conflict" for result in results),
+        results=results
+    )
+
+
+@router.post("/bulk/renew", response_model=TicketBulkResponse)
+async def bulk_renew_tickets(
+    renewal_data: TicketBulkRenew,
+    current_user: User = Depends(require_role("editor")),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Renew many tickets at once, selected by ids or by a filter such as
+    {"assigned_pm": ..., "status": "expiring_soon"}.
+    Requires editor or admin role.
+
+    All tickets are renewed with one UPDATE in one transaction. Like
+    POST /tickets/{id}/renew, archived tickets given by id are moved back
+    into tickets. The response has a result per ticket (not_found for
+    unknown ids, conflict for archived tickets whose ticket number is now
+    in use).
+    """
+    return await _bulk_change(db, renewal_data, {
+        "expiration_date": renewal_data.new_expiration_date,
+        "last_renewed_at": datetime.utcnow(),
+        "status": "renewed"
+    }, "bulk_renewed", restore_archived=True)
+
+
+@router.patch("/bulk", response_model=TicketBulkResponse)
+async def bulk_update_tickets_route(
+    update_data: TicketBulkUpdate,
+    current_user: User = Depends(require_role("editor")),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Apply the same changes to many tickets, selected by ids or by a filter.
+    Requires editor or admin role.
+
+    Works like PUT /tickets/{id} (the status is recalculated from the
+    expiration date) but with one UPDATE in one transaction for all tickets.
+    """
+    values = update_data.changes.dict(exclude_unset=True)
+    if not values:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No changes given"
+        )
+
+    if "expiration_date" in values:
+        values["status"] = determine_status(values["expiration_date"])
+    elif "status" in values:
+        # Each ticket keeps the status its own expiration date calls for
+        values["status"] = current_status_expression()
+
+    return await _bulk_change(db, update_data, values, "bulk_updated")
 
 
 @router.put("/{ticket_id}", response_model=TicketResponse)
@@ -202,19 +823,18 @@ async def update_ticket(
     ticket_id: str,
     ticket_data: TicketUpdate,
     current_user: User = Depends(require_role("editor")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update an existing ticket.
     Requires editor or admin role.
-    """
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
 
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
-        )
+    The status always follows the expiration date (renew a ticket to mark
+    it renewed), since the hourly status job only revisits tickets whose
+    expiration boundaries it crosses.
+    """
+    ticket = await _get_ticket_or_404(db, ticket_id)
+    before = ticket_snapshot(ticket)
 
     # Update fields if provided
     update_data = ticket_data.dict(exclude_unset=True)
@@ -222,12 +842,14 @@ async def update_ticket(
     for field, value in update_data.items():
         setattr(ticket, field, value)
 
-    # Recalculate status if expiration date changed
-    if "expiration_date" in update_data:
+    # Recalculate status if expiration date or status changed
+    if "expiration_date" in update_data or "status" in update_data:
         ticket.status = determine_status(ticket.expiration_date)
 
-    db.commit()
-    db.refresh(ticket)
+    await db.commit()
+    record_ticket_change(before, ticket_snapshot(ticket))
+    await invalidate_ticket_responses()
+    event_hub.publish("updated", ticket_event_data(ticket))
 
     return ticket
 
@@ -237,27 +859,34 @@ async def renew_ticket(
     ticket_id: str,
     renewal_data: TicketRenew,
     current_user: User = Depends(require_role("editor")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Renew a ticket by updating its expiration date and status.
     Requires editor or admin role.
-    """
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
 
-    if not ticket:
+    An archived ticket is moved back into tickets by its renewal.
+    """
+    try:
+        restored = await restore_archived_ticket(db, ticket_id)
+    except ArchiveConflict as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
         )
 
+    ticket = await _get_ticket_or_404(db, ticket_id)
+    before = None if restored else ticket_snapshot(ticket)
+
     # Update expiration date
     ticket.expiration_date = renewal_data.new_expiration_date
     ticket.last_renewed_at = datetime.utcnow()
     ticket.status = "renewed"
 
-    db.commit()
-    db.refresh(ticket)
+    await db.commit()
+    record_ticket_change(before, ticket_snapshot(ticket))
+    await invalidate_ticket_responses()
+    event_hub.publish("renewed", ticket_event_data(ticket))
 
     return ticket
 
@@ -266,21 +895,20 @@ async def renew_ticket(
 async def delete_ticket(
     ticket_id: str,
     current_user: User = Depends(require_role("admin")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a ticket.
     Requires admin role only.
     """
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = await _get_ticket_or_404(db, ticket_id)
 
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
-        )
+    before = ticket_snapshot(ticket)
 
-    db.delete(ticket)
-    db.commit()
+    await db.delete(ticket)
+    await db.commit()
+    record_ticket_change(before=before)
+    await invalidate_ticket_responses()
+    event_hub.publish("deleted", {"id": ticket_id, "ticket_number": ticket.ticket_number})
 
     return None
@@ -3,11 +3,13 @@ User management routes (admin only).
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
-from app.api.deps import require_role
+from app.api.deps import get_read_db, require_role, invalidate_cached_user
+from app.services.response_cache import invalidate_ticket_responses
 
 router = APIRouter()
 
@@ -15,12 +17,13 @@ router = APIRouter()
 @router.get("", response_model=list[UserResponse])
 async def list_users(
     current_user: User = Depends(require_role("admin")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List all users (admin only).
     """
-    users = db.query(User).all()
+    result = await db.execute(select(User))
+    users = result.scalars().all()
     return users
 
 
@@ -28,13 +31,14 @@ async def list_users(
 async def create_user(
     user_data: UserCreate,
     current_user: User = Depends(require_role("admin")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new user (admin only).
     """
     # Check if user with email already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    result = await db.execute(select(User).filter(User.email == user_data.email))
+    existing_user = result.scalars().first()
 
     if existing_user:
         raise HTTPException(
@@ -51,8 +55,8 @@ async def create_user(
     )
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     return user
 
@@ -62,12 +66,13 @@ async def update_user(
     user_id: str,
     user_data: UserUpdate,
     current_user: User = Depends(require_role("admin")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update a user (admin only).
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(select(User).filter(User.id == user_id))
+    user = result.scalars().first()
 
     if not user:
         raise HTTPException(
@@ -81,8 +86,10 @@ async def update_user(
     for field, value in update_data.items():
         setattr(user, field, value)
 
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    invalidate_cached_user(user_id)
+    await invalidate_ticket_responses()
 
     return user
 
@@ -91,7 +98,7 @@ async def update_user(
 async def delete_user(
     user_id: str,
     current_user: User = Depends(require_role("admin")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a user (admin only).
@@ -103,7 +110,8 @@ async def delete_user(
             detail="Cannot delete your own account"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(select(User).filter(User.id == user_id))
+    user = result.scalars().first()
 
     if not user:
         raise HTTPException(
@@ -111,7 +119,9 @@ async def delete_user(
             detail="User not found"
         )
 
-    db.delete(user)
-    db.commit()
+    await db.delete(user)
+    await db.commit()
+    invalidate_cached_user(user_id)
+    await invalidate_ticket_responses()
 
     return None
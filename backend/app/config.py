@@ -12,11 +12,29 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./tickets.db"
+    DATABASE_READ_URL: str = ""  # Read replica for dashboard reads, the primary if empty
+    READ_REPLICA_LAG_SECONDS: float = 10.0  # Users read from the primary this long after their own writes
+    DB_POOL_SIZE: int = 5  # Connections kept open per engine
+    DB_MAX_OVERFLOW: int = 10  # Extra connections opened under load, closed when returned
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0  # Wait for a free connection before failing the request
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # Reconnect older server connections (PostgreSQL)
+    DB_POOL_PRE_PING: bool = True  # Check server connections are alive before use (PostgreSQL)
+
+    # SQLite tuning, applied to every connection
+    SQLITE_TUNING_ENABLED: bool = True  # False keeps SQLite's defaults
+    SQLITE_JOURNAL_MODE: str = "WAL"  # Readers don't wait for the writer; "" keeps the file's mode
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # Durable with WAL except for the last commits on power loss
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # Wait this long for a lock before "database is locked"
+    SQLITE_CACHE_SIZE_KB: int = 65536  # Page cache per connection
+    SQLITE_MMAP_SIZE_MB: int = 256  # Memory-mapped reads, 0 disables
 
     # Auth
     MAGIC_LINK_EXPIRATION_MINUTES: int = 15
+    MAGIC_LINK_SIGNED: bool = False  # Signed links, nothing stored until one is used
     ACCESS_TOKEN_EXPIRE_DAYS: int = 7
     ALGORITHM: str = "HS256"
+    USER_CACHE_TTL_SECONDS: int = 60  # How long get_current_user trusts a cached user
+    USER_CACHE_MAX_SIZE: int = 1024
 
     # Email
     SMTP_HOST: str
@@ -26,12 +44,60 @@ class Settings(BaseSettings):
     SMTP_FROM_EMAIL: str
     SMTP_FROM_NAME: str = "811 Ticket Tracker"
     SMTP_USE_TLS: bool = True
+    EMAIL_API_URL: str = "https://api.sendgrid.com/v3/mail/send"
+    EMAIL_MAX_CONCURRENCY: int = 10  # Emails sent in parallel (and pooled connections)
+    EMAIL_MAX_RETRIES: int = 3
+    EMAIL_RETRY_BACKOFF_SECONDS: float = 1.0
+    EMAIL_MAX_RETRY_AFTER_SECONDS: float = 30.0  # Longest Retry-After waited out before retrying
+
+    # Email outbox
+    OUTBOX_POLL_SECONDS: float = 5.0  # How often the worker checks for due emails
+    OUTBOX_BATCH_SIZE: int = 50
+    OUTBOX_MAX_ATTEMPTS: int = 6  # Delivery attempts before an email is dead-lettered
+    OUTBOX_RETRY_BACKOFF_SECONDS: float = 30.0  # Doubles after each failed attempt
+    OUTBOX_LEASE_SECONDS: int = 120  # Claimed emails are retried if not finished by then
 
     # Notifications
     NOTIFICATION_HOUR: int = 8
     NOTIFICATION_TIMEZONE: str = "America/New_York"
     EXPIRATION_WARNING_DAYS: int = 5
 
+    # Ticket archive
+    ARCHIVE_RETENTION_DAYS: int = 180  # Tickets expired longer than this move to tickets_archive, 0 disables
+    ARCHIVE_BATCH_SIZE: int = 1000  # Tickets moved per transaction
+    ARCHIVE_HOUR: int = 3  # Daily archive run, in NOTIFICATION_TIMEZONE
+
+    # Response cache (ticket list and stats)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_URL: str = ""  # redis://host:6379/0 to share across workers, in-process if empty
+    RESPONSE_CACHE_TTL_SECONDS: int = 60  # Bounds staleness from writes another process made
+    RESPONSE_CACHE_MAX_SIZE: int = 512  # Entries kept by the in-process cache
+
+    # Ticket list serialization
+    TICKET_LIST_FAST_PATH: bool = False  # Encode list pages from plain rows, bypassing ORM objects and validation
+
+    # Response compression (ticket list)
+    RESPONSE_COMPRESSION_ENABLED: bool = True
+    RESPONSE_COMPRESSION_MIN_BYTES: int = 1024  # Smaller bodies are sent uncompressed
+    RESPONSE_COMPRESSION_GZIP_LEVEL: int = 6
+    RESPONSE_COMPRESSION_BROTLI_QUALITY: int = 5  # Used when brotli is installed
+
+    # Ticket event stream (GET /tickets/events)
+    EVENTS_QUEUE_SIZE: int = 100  # Pending events per client before it is sent a reset
+    EVENTS_HISTORY_SIZE: int = 1000  # Recent events kept for resuming with Last-Event-ID
+    EVENTS_HEARTBEAT_SECONDS: float = 15.0  # Keepalive comment interval on idle streams
+    EVENTS_MAX_STREAM_SECONDS: int = 300  # Streams end after this, clients reconnect and resume
+
+    # SQL profiling
+    SQL_PROFILING_ENABLED: bool = False  # Server-Timing headers and repeated-statement log per request
+    SQL_SLOW_QUERY_MS: float = 100.0  # Statements slower than this go to the slow-query log
+    SQL_SLOW_QUERY_LOG: str = ""  # Slow-query log file, stderr if empty
+    SQL_PROFILE_TOP_STATEMENTS: int = 3  # Slowest statements listed in Server-Timing
+    SQL_REPEATED_STATEMENT_THRESHOLD: int = 5  # Same statement this often in one request is flagged (N+1)
+
+    # Stats
+    STATS_MAX_AGE_SECONDS: int = 300  # Recompute the cached summary after this long
+
     # Admin
     ADMIN_EMAIL: str
 
@@ -1,20 +1,156 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
-)
+
+def get_async_database_url(url: str) -> str:
+    """
+    Convert a sync database URL into its async driver equivalent.
+
+    sqlite:// uses aiosqlite and postgresql:// (or postgres://) uses asyncpg.
+    URLs that already name a driver are returned unchanged.
+    """
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if url.startswith("postgresql:"):
+        return url.replace("postgresql:", "postgresql+asyncpg:", 1)
+    if url.startswith("postgres:"):
+        return url.replace("postgres:", "postgresql+asyncpg:", 1)
+    return url
+
+
+def engine_options(url: str, async_driver: bool = False) -> dict:
+    """
+    Get the create_engine() pool and driver options for a database URL.
+
+    Server databases get the DB_POOL_* settings. File-based SQLite gets a
+    connection pool too, so connections (and their page cache and memory
+    map) are reused; aiosqlite would otherwise open one per session.
+
+    Args:
+        url: Database URL
+        async_driver: True for create_async_engine()
+
+    Returns:
+        Keyword arguments for create_engine() / create_async_engine()
+    """
+    url = make_url(url)
+    pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS
+    }
+
+    if url.get_backend_name() != "sqlite":
+        return {
+            **pool_options,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING
+        }
+
+    options = {"connect_args": {"check_same_thread": False}}
+    if url.database and url.database != ":memory:":
+        options.update(pool_options)
+        if async_driver:
+            options["poolclass"] = AsyncAdaptedQueuePool
+    return options
+
+
+def sqlite_pragmas() -> list[str]:
+    """
+    Get the PRAGMA statements run on every new SQLite connection.
+    """
+    if not settings.SQLITE_TUNING_ENABLED:
+        return []
+
+    pragmas = [f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}"]
+    if settings.SQLITE_JOURNAL_MODE:
+        pragmas.append(f"PRAGMA journal_mode = {settings.SQLITE_JOURNAL_MODE}")
+    if settings.SQLITE_SYNCHRONOUS:
+        pragmas.append(f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}")
+    # Negative cache_size is in KiB rather than pages
+    pragmas.append(f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_KB}")
+    pragmas.append(f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE_MB * 1024 * 1024}")
+    pragmas.append("PRAGMA temp_store = MEMORY")
+    return pragmas
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in sqlite_pragmas():
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def configure_sqlite(engine):
+    """
+    Apply the SQLITE_* pragmas to every connection an engine opens.
+    Does nothing for other databases.
+
+    Args:
+        engine: Sync engine (use async_engine.sync_engine for the async one)
+    """
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+
+
+# Sync engine - used for table creation, migrations and scripts (seed.py)
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+configure_sqlite(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async engine - used by the API routes, services and scheduler jobs. Scripts
+# using it must await async_engine.dispose() before exiting: on SQLite each
+# pooled aiosqlite connection has a worker thread that keeps the process alive
+async_engine = create_async_engine(
+    get_async_database_url(settings.DATABASE_URL),
+    **engine_options(settings.DATABASE_URL, async_driver=True)
+)
+configure_sqlite(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+# Read engine - the DATABASE_READ_URL replica used by read-only endpoints
+# (see api/deps.py get_read_db), or the primary if no replica is configured
+if settings.DATABASE_READ_URL:
+    read_engine = create_async_engine(
+        get_async_database_url(settings.DATABASE_READ_URL),
+        **engine_options(settings.DATABASE_READ_URL, async_driver=True)
+    )
+    configure_sqlite(read_engine.sync_engine)
+
+    ReadSessionLocal = async_sessionmaker(
+        bind=read_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+        info={"replica": True}
+    )
+else:
+    read_engine = async_engine
+    ReadSessionLocal = AsyncSessionLocal
+
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+def is_replica_session(db: AsyncSession) -> bool:
+    """
+    Check whether a session reads from the read replica, which may lag
+    behind the primary by up to READ_REPLICA_LAG_SECONDS.
+    """
+    return db.info.get("replica", False)
@@ -2,13 +2,24 @@
 Main FastAPI application for 811 Ticket Tracker.
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from app.config import settings
-from app.database import engine, Base
+from app.database import engine, async_engine, read_engine
+from app.services.email_service import close_http_client
+from app.services.event_hub import event_hub
+from app.services.recent_writes import RecentWriterMiddleware, close_recent_writes
+from app.services.response_cache import close_response_cache, response_cache_stats
+from app.services.search_service import create_search_index
+from app.utils.migrations import upgrade_database
+from app.utils.metrics import MetricsMiddleware, instrument_engine
+from app.utils.sql_profiler import SQLProfilingMiddleware, configure_slow_query_log, profile_engine
 from app.tasks.scheduler import start_scheduler, shutdown_scheduler
+from app.tasks.outbox_worker import start_outbox_worker, shutdown_outbox_worker
 from app.api.routes import auth, tickets, users
+from app.api.deps import user_cache
 
 
 @asynccontextmanager
@@ -19,18 +30,32 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting 811 Ticket Tracker API...")
 
-    # Create database tables
-    Base.metadata.create_all(bind=engine)
-    print("✓ Database tables created")
+    # Create or upgrade database tables
+    upgrade_database(engine)
+    print("✓ Database migrated")
+
+    # Create the ticket search index
+    with engine.begin() as connection:
+        create_search_index(connection)
 
     # Start background scheduler
     start_scheduler()
 
+    # Start email outbox worker
+    start_outbox_worker()
+
     yield
 
     # Shutdown
     print("⏹️  Shutting down...")
     shutdown_scheduler()
+    await shutdown_outbox_worker()
+    await close_http_client()
+    await close_response_cache()
+    await close_recent_writes()
+    await async_engine.dispose()
+    if read_engine is not async_engine:
+        await read_engine.dispose()
 
 
 # Create FastAPI app
@@ -50,6 +75,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Keep replica reads off for READ_REPLICA_LAG_SECONDS after a write finishes
+if settings.DATABASE_READ_URL:
+    app.add_middleware(RecentWriterMiddleware)
+
+# Opt-in per-request SQL profiling: Server-Timing headers and slow-query log
+if settings.SQL_PROFILING_ENABLED:
+    configure_slow_query_log()
+    app.add_middleware(SQLProfilingMiddleware)
+    profile_engine(engine)
+    profile_engine(async_engine.sync_engine)
+    if read_engine is not async_engine:
+        profile_engine(read_engine.sync_engine)
+
+# Record per-route latency and SQL usage, outermost so it times everything
+app.add_middleware(MetricsMiddleware)
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
+if read_engine is not async_engine:
+    instrument_engine(read_engine.sync_engine, "read")
+
 # Include API routes
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(tickets.router, prefix="/api/v1/tickets", tags=["Tickets"])
@@ -77,5 +122,17 @@ async def health_check():
     """
     return {
         "status": "healthy",
-        "service": "811-ticket-tracker-api"
+        "service": "811-ticket-tracker-api",
+        "user_cache": user_cache.stats(),
+        "response_cache": response_cache_stats(),
+        "event_streams": event_hub.stats(),
+        "read_replica": read_engine is not async_engine
     }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus metrics for the API, database and scheduled jobs.
+    """
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
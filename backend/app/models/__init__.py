@@ -1,5 +1,10 @@
 from app.models.user import User
 from app.models.ticket import Ticket
+from app.models.ticket_archive import TicketArchive
 from app.models.magic_link import MagicLink
+from app.models.magic_link_nonce import MagicLinkNonce
+from app.models.email_outbox import EmailOutbox
+from app.models.job_watermark import JobWatermark
+from app.models.table_version import TableVersion
 
-__all__ = ["User", "Ticket", "MagicLink"]
+__all__ = ["User", "Ticket", "TicketArchive", "MagicLink", "MagicLinkNonce", "EmailOutbox", "JobWatermark", "TableVersion"]
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+from app.database import Base
+from app.config import settings
+
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+
+    id = Column(UUID(as_uuid=True) if "postgresql" in settings.DATABASE_URL else String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    recipient = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    html_body = Column(Text, nullable=False)
+    status = Column(String(20), nullable=False, default="pending")  # pending, sending, sent, dead
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False)
+    last_error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        # The worker polls for due pending/sending rows
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Date, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class JobWatermark(Base):
+    __tablename__ = "job_watermarks"
+
+    name = Column(String(100), primary_key=True)
+    value = Column(Date, nullable=False)  # Last date the job processed
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
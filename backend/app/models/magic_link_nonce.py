@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, DateTime
+from app.database import Base
+
+
+# Nonces of signed magic links that have been used (MAGIC_LINK_SIGNED). A
+# signed link is only stored here once it is used, and only until it would
+# have expired anyway, when the purge job deletes it.
+class MagicLinkNonce(Base):
+    __tablename__ = "magic_link_nonces"
+
+    nonce = Column(String(32), primary_key=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
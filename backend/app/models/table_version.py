@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, BigInteger
+from app.database import Base
+
+
+class TableVersion(Base):
+    __tablename__ = "table_versions"
+
+    # Bumped by database triggers on every write to the named table, see
+    # alembic/versions/0005_row_and_table_versions.py
+    name = Column(String(50), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
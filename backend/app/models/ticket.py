@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Date, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, Date, DateTime, ForeignKey, Index, Integer, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -17,14 +17,28 @@ class Ticket(Base):
     state = Column(String(2), nullable=False, index=True)
     submit_date = Column(Date, nullable=False)
     expiration_date = Column(Date, nullable=False, index=True)
-    status = Column(String(20), nullable=False, default="active", index=True)  # active, expiring_soon, expired, renewed
+    status = Column(String(20), nullable=False, default="active")  # active, expiring_soon, expired, renewed
     utility_responses = Column(Text)
-    assigned_pm = Column(String(255), index=True)
+    assigned_pm = Column(String(255))
     created_by_id = Column(UUID(as_uuid=True) if "postgresql" in settings.DATABASE_URL else String(36), ForeignKey("users.id"), nullable=True)
     notes = Column(Text)
     last_renewed_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Incremented by every UPDATE, ORM or Core; the ticket's ETag is built from it
+    version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=text("version + 1"))
 
     # Relationships
     created_by = relationship("User", back_populates="tickets")
+
+    # Fetch created_at/updated_at with RETURNING on INSERT/UPDATE instead of
+    # leaving them expired, so a written ticket can be serialized without a reload
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Indexes for the hot query shapes, see alembic/versions/0003_ticket_query_indexes.py
+    __table_args__ = (
+        # Status filter plus expiration range or order (expiring tickets, status list)
+        Index("ix_tickets_status_expiration_date", "status", "expiration_date", "id"),
+        # One PM's tickets ordered by expiration
+        Index("ix_tickets_assigned_pm_expiration_date", "assigned_pm", "expiration_date", "id"),
+    )
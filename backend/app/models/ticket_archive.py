@@ -0,0 +1,33 @@
+from sqlalchemy import Column, String, Text, Date, DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database import Base
+from app.config import settings
+
+
+# Tickets expired longer than ARCHIVE_RETENTION_DAYS, moved out of tickets by
+# the archive job (see services/archive_service.py). Same columns as Ticket.
+class TicketArchive(Base):
+    __tablename__ = "tickets_archive"
+
+    id = Column(UUID(as_uuid=True) if "postgresql" in settings.DATABASE_URL else String(36), primary_key=True)
+    ticket_number = Column(String(100), nullable=False, index=True)
+    job_name = Column(String(255), nullable=False)
+    address = Column(Text, nullable=False)
+    state = Column(String(2), nullable=False)
+    submit_date = Column(Date, nullable=False)
+    expiration_date = Column(Date, nullable=False, index=True)
+    status = Column(String(20), nullable=False)
+    utility_responses = Column(Text)
+    assigned_pm = Column(String(255))
+    created_by_id = Column(UUID(as_uuid=True) if "postgresql" in settings.DATABASE_URL else String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    notes = Column(Text)
+    last_renewed_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    version = Column(Integer, nullable=False)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    created_by = relationship("User", viewonly=True)
@@ -1,9 +1,13 @@
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
-from app.schemas.ticket import TicketCreate, TicketUpdate, TicketResponse, TicketRenew, TicketStats
+from app.schemas.ticket import (
+    TicketCreate, TicketUpdate, TicketResponse, TicketRenew, TicketStats, TicketCount,
+    TicketImportResponse
+)
 from app.schemas.auth import MagicLinkRequest, TokenResponse, UserInToken
 
 __all__ = [
     "UserCreate", "UserUpdate", "UserResponse",
-    "TicketCreate", "TicketUpdate", "TicketResponse", "TicketRenew", "TicketStats",
+    "TicketCreate", "TicketUpdate", "TicketResponse", "TicketRenew", "TicketStats", "TicketCount",
+    "TicketImportResponse",
     "MagicLinkRequest", "TokenResponse", "UserInToken"
 ]
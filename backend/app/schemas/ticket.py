@@ -1,4 +1,4 @@
-from pydantic import BaseModel, field_serializer
+from pydantic import BaseModel, Field, field_serializer, model_validator
 from typing import Optional
 from datetime import date, datetime
 from uuid import UUID
@@ -56,6 +56,7 @@ class TicketResponse(TicketBase):
     created_by: Optional[UserMin] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
+    archived_at: Optional[datetime] = None  # Set on archived tickets only
 
     @field_serializer('id')
     def serialize_id(self, value, _info):
@@ -67,9 +68,71 @@ class TicketResponse(TicketBase):
 
 class TicketListResponse(BaseModel):
     tickets: list[TicketResponse]
-    total: int
+    total: Optional[int] = None  # None when include_total=false
     skip: int
     limit: int
+    next_cursor: Optional[str] = None  # None on the last page
+
+
+class TicketCount(BaseModel):
+    total: int
+
+
+class TicketImportError(BaseModel):
+    row: int  # Data row (CSV) or line (NDJSON) number, starting at 1
+    ticket_number: Optional[str] = None
+    error: str
+
+
+class TicketImportResponse(BaseModel):
+    total_rows: int = 0
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0  # Archived, or already existed and update_existing was false
+    errors: list[TicketImportError] = []
+
+
+class TicketBulkFilter(BaseModel):
+    assigned_pm: Optional[str] = None
+    status: Optional[str] = None
+    state: Optional[str] = None
+
+
+class TicketBulkSelection(BaseModel):
+    # Either a list of ids or a filter with at least one field
+    ids: Optional[list[str]] = Field(None, max_length=1000)
+    filter: Optional[TicketBulkFilter] = None
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Give either ids or filter")
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("filter needs at least one of assigned_pm, status or state")
+        return self
+
+
+class TicketBulkRenew(TicketBulkSelection):
+    new_expiration_date: date
+
+
+class TicketBulkUpdate(TicketBulkSelection):
+    changes: TicketUpdate
+
+
+class TicketBulkResult(BaseModel):
+    id: str
+    result: str  # updated, not_found or conflict (archived, ticket number in use)
+    ticket_number: Optional[str] = None
+    status: Optional[str] = None
+    expiration_date: Optional[date] = None
+
+
+class TicketBulkResponse(BaseModel):
+    updated: int
+    not_found: int
+    conflicts: int = 0
+    results: list[TicketBulkResult]
 
 
 class TicketStats(BaseModel):
@@ -80,3 +143,5 @@ class TicketStats(BaseModel):
     renewed_tickets: int
     tickets_by_state: dict[str, int]
     expiring_in_next_7_days: int
+    computed_at: Optional[datetime] = None  # Last full recompute
+    updated_at: Optional[datetime] = None  # Last incremental update
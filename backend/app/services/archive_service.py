@@ -0,0 +1,180 @@
+"""
+Archive service: moves long-expired tickets out of the tickets table.
+
+Tickets expired more than ARCHIVE_RETENTION_DAYS ago are copied to
+tickets_archive and deleted from tickets in batches of ARCHIVE_BATCH_SIZE,
+one transaction per batch, so the hot table and its indexes only hold
+tickets people still work with. Archived tickets keep their id and are
+listed or exported again with include_archived=true. Renewing an archived
+ticket moves it back into tickets.
+"""
+
+from datetime import date, timedelta
+from typing import Optional
+from sqlalchemy import delete, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.ticket import Ticket
+from app.models.ticket_archive import TicketArchive
+from app.services.event_hub import publish_ticket_batch
+from app.services.response_cache import invalidate_ticket_responses
+from app.services.stats_service import refresh_ticket_stats
+from app.config import settings
+
+# Columns copied between tickets and tickets_archive
+TICKET_FIELDS = [column.key for column in Ticket.__table__.columns]
+
+
+class ArchiveConflict(Exception):
+    """
+    An archived ticket can't be restored because its ticket number is in use.
+    """
+
+
+async def archive_expired_tickets(
+    db: AsyncSession,
+    retention_days: Optional[int] = None,
+    batch_size: Optional[int] = None
+) -> list[dict]:
+    """
+    Move tickets expired longer than the retention period to tickets_archive.
+    This function is called daily by the scheduler.
+
+    Args:
+        db: Database session
+        retention_days: Days after expiration tickets are kept (default from settings)
+        batch_size: Tickets moved per transaction (default from settings)
+
+    Returns:
+        Archived tickets (id, ticket_number)
+    """
+    if retention_days is None:
+        retention_days = settings.ARCHIVE_RETENTION_DAYS
+    if batch_size is None:
+        batch_size = settings.ARCHIVE_BATCH_SIZE
+
+    cutoff = date.today() - timedelta(days=retention_days)
+    archived = []
+
+    try:
+        while True:
+            result = await db.execute(
+                select(Ticket.id).filter(Ticket.expiration_date < cutoff).limit(batch_size)
+            )
+            ids = result.scalars().all()
+            if not ids:
+                break
+
+            # Archived tickets are expired whatever the status job last set
+            archive_columns = [
+                literal("expired").label("status") if field == "status" else getattr(Ticket, field)
+                for field in TICKET_FIELDS
+            ]
+            await db.execute(
+                insert(TicketArchive).from_select(
+                    TICKET_FIELDS, select(*archive_columns).filter(Ticket.id.in_(ids))
+                )
+            )
+            result = await db.execute(
+                delete(Ticket).filter(Ticket.id.in_(ids))
+                .returning(Ticket.id, Ticket.ticket_number)
+                .execution_options(synchronize_session=False)
+            )
+            archived += [{"id": str(row.id), "ticket_number": row.ticket_number} for row in result]
+
+            await db.commit()
+
+        if archived:
+            await refresh_ticket_stats(db)
+            await invalidate_ticket_responses()
+            publish_ticket_batch("archived", archived)
+
+        print(f"Archive complete: {len(archived)} tickets expired before {cutoff.isoformat()} archived")
+
+        return archived
+
+    except Exception as e:
+        await db.rollback()
+        print(f"Error archiving tickets: {e}")
+        raise
+
+
+async def restore_archived_ticket(db: AsyncSession, ticket_id: str) -> bool:
+    """
+    Move an archived ticket back into tickets, keeping its id.
+
+    The caller commits, so the restore and the change that needed it
+    (e.g. a renewal) happen in one transaction.
+
+    Args:
+        db: Database session
+        ticket_id: Ticket id
+
+    Returns:
+        True if the ticket was archived and has been restored
+
+    Raises:
+        ArchiveConflict: A ticket with the same ticket number exists
+    """
+    ticket_number = await db.scalar(
+        select(TicketArchive.ticket_number).filter(TicketArchive.id == ticket_id)
+    )
+    if ticket_number is None:
+        return False
+
+    existing = await db.scalar(select(Ticket.id).filter(Ticket.ticket_number == ticket_number))
+    if existing is not None:
+        raise ArchiveConflict(f"Ticket number {ticket_number} is in use by another ticket")
+
+    await db.execute(
+        insert(Ticket).from_select(
+            TICKET_FIELDS,
+            select(*[getattr(TicketArchive, field) for field in TICKET_FIELDS])
+            .filter(TicketArchive.id == ticket_id)
+        )
+    )
+    await db.execute(delete(TicketArchive).filter(TicketArchive.id == ticket_id))
+
+    return True
+
+
+async def restore_archived_tickets(db: AsyncSession, ticket_ids: list[str]) -> tuple[list[str], list[str]]:
+    """
+    Move archived tickets back into tickets, keeping their ids, with the
+    same few statements however many there are.
+
+    Like restore_archived_ticket() the caller commits, and a ticket whose
+    ticket number is now used by another ticket stays archived.
+
+    Args:
+        db: Database session
+        ticket_ids: Ticket ids (valid UUIDs), archived or not
+
+    Returns:
+        (restored ids, ids left archived because of a ticket number conflict)
+    """
+    if not ticket_ids:
+        return [], []
+
+    result = await db.execute(
+        select(TicketArchive.id, Ticket.id.is_not(None).label("conflict"))
+        .outerjoin(Ticket, Ticket.ticket_number == TicketArchive.ticket_number)
+        .filter(TicketArchive.id.in_(ticket_ids))
+    )
+    restored, conflicts = [], []
+    for row in result:
+        (conflicts if row.conflict else restored).append(str(row.id))
+
+    if restored:
+        await db.execute(
+            insert(Ticket).from_select(
+                TICKET_FIELDS,
+                select(*[getattr(TicketArchive, field) for field in TICKET_FIELDS])
+                .filter(TicketArchive.id.in_(restored))
+            )
+        )
+        await db.execute(
+            delete(TicketArchive).filter(TicketArchive.id.in_(restored))
+            .execution_options(synchronize_session=False)
+        )
+
+    return restored, conflicts
@@ -1,18 +1,33 @@
 """
 Authentication service for magic link generation and validation.
+
+By default every magic link is a magic_links row. With MAGIC_LINK_SIGNED,
+links are HMAC-signed tokens carrying the user id, expiration and a nonce
+(see utils/security.py), so requesting one writes nothing; using one
+stores its nonce in magic_link_nonces to stop it being used again. Either
+kind of link is checked and consumed with a single statement, and
+purge_magic_links() deletes rows that can no longer be used.
 """
 
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
 from app.models.magic_link import MagicLink
+from app.models.magic_link_nonce import MagicLinkNonce
 from app.config import settings
-from app.utils.security import create_access_token
+from app.utils.security import create_access_token, create_magic_link_token, decode_magic_link_token
+
+# Rows deleted per statement by purge_magic_links()
+PURGE_BATCH_SIZE = 5000
 
 
-def generate_magic_link(user_id: str, db: Session) -> str:
+async def generate_magic_link(user_id: str, db: AsyncSession) -> str:
     """
     Generate a magic link token for a user.
 
@@ -23,12 +38,16 @@ def generate_magic_link(user_id: str, db: Session) -> str:
     Returns:
         Magic link token string
     """
-    # Generate unique token
-    token = str(uuid.uuid4())
-
     # Calculate expiration time
     expires_at = datetime.utcnow() + timedelta(minutes=settings.MAGIC_LINK_EXPIRATION_MINUTES)
 
+    # Signed links are only stored once used
+    if settings.MAGIC_LINK_SIGNED:
+        return create_magic_link_token(user_id, expires_at)
+
+    # Generate unique token
+    token = str(uuid.uuid4())
+
     # Create magic link record
     magic_link = MagicLink(
         user_id=user_id,
@@ -38,12 +57,65 @@ def generate_magic_link(user_id: str, db: Session) -> str:
     )
 
     db.add(magic_link)
-    db.commit()
+    await db.commit()
 
     return token
 
 
-def verify_magic_link(token: str, db: Session) -> Optional[User]:
+def _consume_nonce_statement(dialect_name: str, nonce: str, expires_at: datetime):
+    """
+    Build an INSERT of a used nonce that returns it only if it was new.
+    """
+    values = {"nonce": nonce, "expires_at": expires_at}
+    if dialect_name == "postgresql":
+        statement = postgresql_insert(MagicLinkNonce).values(**values).on_conflict_do_nothing()
+    elif dialect_name == "sqlite":
+        statement = sqlite_insert(MagicLinkNonce).values(**values).on_conflict_do_nothing()
+    else:
+        # Elsewhere a reused nonce fails with IntegrityError
+        statement = insert(MagicLinkNonce).values(**values)
+    return statement.returning(MagicLinkNonce.nonce)
+
+
+async def _consume_magic_link(token: str, db: AsyncSession) -> Optional[str]:
+    """
+    Mark a magic link used, if it is valid and unused.
+
+    Returns:
+        The link's user id, or None if it is invalid, expired or used
+    """
+    # Signed tokens are user_id.expires.nonce.signature, stored ones are UUIDs
+    if token.count(".") == 3:
+        decoded = decode_magic_link_token(token)
+        if decoded is None:
+            return None
+
+        user_id, nonce, expires_at = decoded
+        try:
+            result = await db.execute(_consume_nonce_statement(db.bind.dialect.name, nonce, expires_at))
+        except IntegrityError:
+            await db.rollback()
+            return None
+        return user_id if result.scalar() is not None else None
+
+    # Checking and marking in one statement means two concurrent
+    # verifications can't both succeed
+    result = await db.execute(
+        update(MagicLink)
+        .filter(
+            MagicLink.token == token,
+            MagicLink.used.is_not(True),
+            MagicLink.expires_at >= datetime.utcnow()
+        )
+        .values(used=True)
+        .returning(MagicLink.user_id)
+        .execution_options(synchronize_session=False)
+    )
+    user_id = result.scalar()
+    return str(user_id) if user_id is not None else None
+
+
+async def verify_magic_link(token: str, db: AsyncSession) -> Optional[User]:
     """
     Verify a magic link token and return the associated user.
 
@@ -54,26 +126,56 @@ def verify_magic_link(token: str, db: Session) -> Optional[User]:
     Returns:
         User object if valid, None otherwise
     """
-    # Find magic link
-    magic_link = db.query(MagicLink).filter(MagicLink.token == token).first()
-
-    if not magic_link:
+    user_id = await _consume_magic_link(token, db)
+    if user_id is None:
         return None
 
-    # Check if already used
-    if magic_link.used:
-        return None
+    await db.commit()
 
-    # Check if expired
-    if datetime.utcnow() > magic_link.expires_at:
-        return None
+    # Return user
+    result = await db.execute(select(User).filter(User.id == user_id))
+    return result.scalars().first()
 
-    # Mark as used
-    magic_link.used = True
-    db.commit()
 
-    # Return user
-    return db.query(User).filter(User.id == magic_link.user_id).first()
+async def purge_magic_links(db: AsyncSession) -> int:
+    """
+    Delete magic links and used nonces that can no longer be used.
+    This function is called hourly by the scheduler.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of rows deleted
+    """
+    now = datetime.utcnow()
+    purged = 0
+
+    try:
+        for model, condition in (
+            (MagicLink, or_(MagicLink.used.is_(True), MagicLink.expires_at < now)),
+            (MagicLinkNonce, MagicLinkNonce.expires_at < now),
+        ):
+            key = model.__table__.primary_key.columns.values()[0]
+            # Batched, so a long-unpurged table doesn't lock for one huge delete
+            while True:
+                result = await db.execute(
+                    delete(model)
+                    .filter(key.in_(select(key).filter(condition).limit(PURGE_BATCH_SIZE)))
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+                purged += result.rowcount
+                if result.rowcount < PURGE_BATCH_SIZE:
+                    break
+
+        print(f"Magic link purge complete: {purged} rows deleted")
+        return purged
+
+    except Exception as e:
+        await db.rollback()
+        print(f"Error purging magic links: {e}")
+        raise
 
 
 def create_user_token(user: User) -> str:
@@ -3,72 +3,164 @@ Email service for sending magic links and notifications.
 Uses SendGrid HTTP API (more reliable than SMTP on cloud platforms).
 """
 
+import asyncio
+import random
 import httpx
-from typing import List
+from typing import List, Optional
 from app.config import settings
 
+# Status codes worth retrying: rate limiting and server-side failures
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 
-async def send_email(to: str, subject: str, html_body: str):
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for the email API.
+
+    The client is created on first use and keeps a pool of connections
+    open, so consecutive emails reuse the same TCP/TLS connection.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_connections=settings.EMAIL_MAX_CONCURRENCY,
+                max_keepalive_connections=settings.EMAIL_MAX_CONCURRENCY
+            )
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """
+    Close the shared HTTP client. Called on application shutdown.
+    """
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+class EmailSendError(Exception):
+    """
+    The email API rejected an email.
+
+    Attributes:
+        retry_after: Seconds the API asked us to wait (Retry-After), if any
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _retry_after(response: Optional[httpx.Response]) -> Optional[float]:
+    """
+    Seconds from a response's Retry-After header, if it has one.
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+    return None
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    Seconds to wait before a retry: Retry-After if given (at most
+    EMAIL_MAX_RETRY_AFTER_SECONDS), else exponential backoff with jitter.
+    """
+    retry_after = _retry_after(response)
+    if retry_after is not None:
+        return min(retry_after, settings.EMAIL_MAX_RETRY_AFTER_SECONDS)
+
+    return settings.EMAIL_RETRY_BACKOFF_SECONDS * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+async def send_email(to: str, subject: str, html_body: str, max_retries: Optional[int] = None):
     """
     Send an email using SendGrid HTTP API.
 
+    Rate limited (429), 5xx and connection failures are retried up to
+    max_retries times with backoff.
+
     Args:
         to: Recipient email address
         subject: Email subject
         html_body: HTML content of the email
+        max_retries: Retries after the first attempt (default EMAIL_MAX_RETRIES)
+
+    Raises:
+        EmailSendError: If the API rejected the email
     """
-    try:
-        # SendGrid API endpoint
-        url = "https://api.sendgrid.com/v3/mail/send"
-
-        # Prepare email data
-        data = {
-            "personalizations": [
-                {
-                    "to": [{"email": to}],
-                    "subject": subject
-                }
-            ],
-            "from": {
-                "email": settings.SMTP_FROM_EMAIL,
-                "name": settings.SMTP_FROM_NAME
-            },
-            "content": [
-                {
-                    "type": "text/html",
-                    "value": html_body
-                }
-            ]
-        }
-
-        # Headers with API key
-        headers = {
-            "Authorization": f"Bearer {settings.SMTP_PASSWORD}",  # SendGrid API key
-            "Content-Type": "application/json"
-        }
-
-        # Send via HTTP POST
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=data, headers=headers, timeout=10.0)
+    if max_retries is None:
+        max_retries = settings.EMAIL_MAX_RETRIES
+
+    # Prepare email data
+    data = {
+        "personalizations": [
+            {
+                "to": [{"email": to}],
+                "subject": subject
+            }
+        ],
+        "from": {
+            "email": settings.SMTP_FROM_EMAIL,
+            "name": settings.SMTP_FROM_NAME
+        },
+        "content": [
+            {
+                "type": "text/html",
+                "value": html_body
+            }
+        ]
+    }
+
+    # Headers with API key
+    headers = {
+        "Authorization": f"Bearer {settings.SMTP_PASSWORD}",  # SendGrid API key
+        "Content-Type": "application/json"
+    }
+
+    client = get_http_client()
+
+    for attempt in range(max_retries + 1):
+        response = None
+        try:
+            # Send via HTTP POST
+            response = await client.post(settings.EMAIL_API_URL, json=data, headers=headers)
             response.raise_for_status()
 
-        print(f"✅ Email sent successfully to {to}")
+            print(f"✅ Email sent successfully to {to}")
+            return
 
-    except httpx.HTTPStatusError as e:
-        print(f"❌ SendGrid API error: {e.response.status_code} - {e.response.text}")
-        raise Exception(f"Failed to send email: {e.response.text}")
-    except Exception as e:
-        print(f"❌ Error sending email: {e}")
-        raise
+        except httpx.HTTPStatusError as e:
+            retryable = e.response.status_code in RETRYABLE_STATUS_CODES
+            if not retryable or attempt == max_retries:
+                print(f"❌ SendGrid API error: {e.response.status_code} - {e.response.text}")
+                raise EmailSendError(f"Failed to send email: {e.response.text}", _retry_after(e.response))
+        except (httpx.TimeoutException, httpx.NetworkError) as e:
+            if attempt == max_retries:
+                print(f"❌ Error sending email: {e}")
+                raise
 
+        delay = _retry_delay(attempt, response)
+        print(f"⚠️  Email to {to} failed (attempt {attempt + 1}), retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
 
-async def send_magic_link_email(email: str, magic_link_url: str):
+
+def render_magic_link_email(magic_link_url: str) -> tuple[str, str]:
     """
-    Send a magic link email for passwordless authentication.
+    Build the subject and HTML body of a magic link email.
 
     Args:
-        email: Recipient's email address
         magic_link_url: Full URL for the magic link
+
+    Returns:
+        (subject, html_body)
     """
     subject = f"Login to {settings.APP_NAME}"
 
@@ -109,17 +201,19 @@ async def send_magic_link_email(email: str, magic_link_url: str):
     </html>
     """
 
-    await send_email(to=email, subject=subject, html_body=html_body)
+    return subject, html_body
 
 
-async def send_expiration_reminder(tickets: List[dict], recipient: str, pm_name: str):
+def render_expiration_reminder(tickets: List[dict], pm_name: str) -> tuple[str, str]:
     """
-    Send an expiration reminder email for tickets.
+    Build the subject and HTML body of an expiration reminder email.
 
     Args:
         tickets: List of ticket dictionaries with expiration info
-        recipient: Email address to send to
         pm_name: Name of the project manager
+
+    Returns:
+        (subject, html_body)
     """
     subject = f"{settings.APP_NAME}: {len(tickets)} ticket(s) expiring soon"
 
@@ -188,4 +282,5 @@ async def send_expiration_reminder(tickets: List[dict], recipient: str, pm_name:
     </html>
     """
 
-    await send_email(to=recipient, subject=subject, html_body=html_body)
+    return subject, html_body
+
@@ -0,0 +1,241 @@
+"""
+In-process broadcast hub for ticket change events.
+
+Ticket routes, the import and the status job publish events here, and
+every GET /tickets/events stream subscribes to them, so open tabs learn
+about changes without polling list_tickets.
+
+Each subscriber has a bounded queue. Publishing never waits: if a slow
+client's queue is full, its pending events are dropped and it is sent a
+single "reset" event telling it to refetch everything instead.
+
+Event ids are "<boot id>-<sequence>". A reconnecting client sends the
+last id it saw (the browser does this with Last-Event-ID) and is replayed
+what it missed from the last EVENTS_HISTORY_SIZE events. If that is not
+possible (too old, or the server restarted since) it gets a "reset".
+
+Events are only seen by streams on the same process, like the response
+cache without RESPONSE_CACHE_URL.
+"""
+
+import asyncio
+import json
+import secrets
+from collections import deque
+from typing import Optional
+from app.config import settings
+
+# Tickets listed in one batch event, larger batches only send the count
+BATCH_EVENT_TICKET_LIMIT = 100
+
+# How long browsers wait before reconnecting a dropped stream
+RECONNECT_MILLISECONDS = 3000
+
+
+class TicketEvent:
+    """
+    A published event: SSE id, event type and JSON-serializable data.
+    """
+
+    def __init__(self, event_id: str, event_type: str, data: dict):
+        self.id = event_id
+        self.type = event_type
+        self.data = data
+
+
+class Subscriber:
+    """
+    One event stream's bounded queue of pending events.
+
+    None in the queue means events were dropped and a reset must be sent.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+    def push(self, event: TicketEvent):
+        if self.dropped:
+            return
+
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+            self.dropped = True
+
+    async def next(self, timeout: float) -> Optional[TicketEvent]:
+        """
+        Wait for the next event.
+
+        Returns:
+            The event, None when a reset is due
+
+        Raises:
+            asyncio.TimeoutError: If nothing arrives within timeout seconds
+        """
+        event = await asyncio.wait_for(self.queue.get(), timeout)
+        if event is None:
+            self.dropped = False
+        return event
+
+
+class EventHub:
+    """
+    Fans published events out to subscribers and keeps recent history
+    for resuming.
+    """
+
+    def __init__(self, history_size: int, queue_size: int):
+        self.boot_id = secrets.token_hex(4)
+        self.sequence = 0
+        self.history: deque[TicketEvent] = deque(maxlen=history_size)
+        self.queue_size = queue_size
+        self.subscribers: set[Subscriber] = set()
+
+    @property
+    def last_event_id(self) -> str:
+        return f"{self.boot_id}-{self.sequence}"
+
+    def publish(self, event_type: str, data: dict) -> TicketEvent:
+        """
+        Publish an event to every subscriber. Never blocks.
+        """
+        self.sequence += 1
+        event = TicketEvent(self.last_event_id, event_type, data)
+        self.history.append(event)
+
+        for subscriber in self.subscribers:
+            subscriber.push(event)
+
+        return event
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> tuple[Subscriber, bool]:
+        """
+        Add a subscriber, replaying the events after last_event_id.
+
+        Args:
+            last_event_id: Resume token from a previous stream, if any
+
+        Returns:
+            (subscriber, resumed): resumed is False when last_event_id was
+            given but the missed events are no longer known
+        """
+        subscriber = Subscriber(self.queue_size)
+        resumed = True
+
+        if last_event_id:
+            missed = self._events_after(last_event_id)
+            if missed is None:
+                resumed = False
+            else:
+                for event in missed:
+                    subscriber.push(event)
+
+        self.subscribers.add(subscriber)
+        return subscriber, resumed
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self.subscribers.discard(subscriber)
+
+    def _events_after(self, last_event_id: str) -> Optional[list[TicketEvent]]:
+        boot_id, _, sequence = last_event_id.partition("-")
+        if boot_id != self.boot_id or not sequence.isdigit():
+            return None
+
+        sequence = int(sequence)
+        if sequence > self.sequence:
+            return None
+        if sequence == self.sequence:
+            return []
+
+        oldest = self.sequence - len(self.history) + 1
+        if sequence + 1 < oldest:
+            return None
+        return list(self.history)[sequence + 1 - oldest:]
+
+    def stats(self) -> dict:
+        return {"subscribers": len(self.subscribers), "last_event_id": self.last_event_id}
+
+
+event_hub = EventHub(settings.EVENTS_HISTORY_SIZE, settings.EVENTS_QUEUE_SIZE)
+
+
+def ticket_event_data(ticket) -> dict:
+    """
+    Get the event payload for a ticket.
+    """
+    return {
+        "id": str(ticket.id),
+        "ticket_number": ticket.ticket_number,
+        "status": ticket.status,
+        "expiration_date": ticket.expiration_date.isoformat(),
+        "assigned_pm": ticket.assigned_pm
+    }
+
+
+def publish_ticket_batch(event_type: str, tickets: list[dict]):
+    """
+    Publish a change to many tickets (status job, bulk renew/update) as
+    one event, rather than one per ticket that would overflow client queues.
+    """
+    if not tickets:
+        return
+
+    event_hub.publish(event_type, {
+        "count": len(tickets),
+        "tickets": tickets if len(tickets) <= BATCH_EVENT_TICKET_LIMIT else None
+    })
+
+
+def format_sse(event_type: str, data: dict, event_id: Optional[str] = None) -> str:
+    """
+    Format one server-sent event message.
+    """
+    lines = [f"id: {event_id}"] if event_id else []
+    lines += [f"event: {event_type}", f"data: {json.dumps(data, default=str)}"]
+    return "\n".join(lines) + "\n\n"
+
+
+async def stream_ticket_events(last_event_id: Optional[str] = None):
+    """
+    Yield server-sent event messages for one client until it disconnects
+    or EVENTS_MAX_STREAM_SECONDS pass.
+
+    A new stream starts with a "ready" event carrying the current id, so
+    the client has a resume token even if nothing happens. Streams end
+    after EVENTS_MAX_STREAM_SECONDS so server shutdown never waits on them
+    for long; browsers reconnect and resume transparently.
+
+    Args:
+        last_event_id: Resume token (Last-Event-ID) from a previous stream
+    """
+    subscriber, resumed = event_hub.subscribe(last_event_id)
+    current_id = event_hub.last_event_id
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.EVENTS_MAX_STREAM_SECONDS
+
+    try:
+        yield f"retry: {RECONNECT_MILLISECONDS}\n\n"
+        if not last_event_id:
+            yield format_sse("ready", {}, current_id)
+        elif not resumed:
+            yield format_sse("reset", {}, current_id)
+
+        while loop.time() < deadline:
+            try:
+                event = await subscriber.next(
+                    min(settings.EVENTS_HEARTBEAT_SECONDS, max(deadline - loop.time(), 0))
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+
+            if event is None:
+                yield format_sse("reset", {}, event_hub.last_event_id)
+            else:
+                yield format_sse(event.type, event.data, event.id)
+    finally:
+        event_hub.unsubscribe(subscriber)
@@ -0,0 +1,243 @@
+"""
+Bulk ticket import from CSV or NDJSON uploads.
+
+Rows are read from the uploaded file in batches, validated with the
+TicketCreate schema, checked for duplicates (archived tickets included)
+with one ticket_number lookup per batch, and inserted with a single multi-row INSERT per batch, so an
+import of thousands of tickets costs a handful of statements per batch
+instead of three per ticket.
+"""
+
+import csv
+import io
+import json
+from typing import Iterator, Optional
+from pydantic import ValidationError
+from sqlalchemy import select, func, literal
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app.models.ticket import Ticket
+from app.models.ticket_archive import TicketArchive
+from app.schemas.ticket import TicketCreate, TicketImportError, TicketImportResponse
+from app.services.event_hub import event_hub
+from app.services.response_cache import invalidate_ticket_responses
+from app.services.stats_service import invalidate_ticket_stats
+from app.services.ticket_service import calculate_ticket_expiration
+from app.utils.expiration import determine_status
+
+IMPORT_BATCH_SIZE = 500
+
+# Fields an upsert overwrites on an existing ticket
+UPSERT_FIELDS = [
+    "job_name", "address", "state", "submit_date", "expiration_date", "status",
+    "utility_responses", "assigned_pm", "notes"
+]
+
+
+def iter_csv_rows(file) -> Iterator[tuple[int, Optional[dict], Optional[str]]]:
+    """
+    Yield (row number, row dict, parse error) for each CSV data row.
+
+    The header row names the TicketCreate fields; empty cells become None.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text)
+
+    for row_number, row in enumerate(reader, start=1):
+        yield row_number, {key: (value or None) for key, value in row.items() if key}, None
+
+
+def iter_ndjson_rows(file) -> Iterator[tuple[int, Optional[dict], Optional[str]]]:
+    """
+    Yield (line number, row dict, parse error) for each NDJSON line.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig")
+
+    for row_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield row_number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(row, dict):
+            yield row_number, None, "Expected a JSON object"
+            continue
+        yield row_number, row, None
+
+
+def _next_batch(rows: Iterator, size: int) -> list:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            break
+    return batch
+
+
+def _upsert_statement(dialect_name: str, update_existing: bool):
+    """
+    Build an INSERT that skips or updates rows whose ticket_number exists.
+    """
+    if dialect_name == "postgresql":
+        statement = postgresql_insert(Ticket)
+    elif dialect_name == "sqlite":
+        statement = sqlite_insert(Ticket)
+    else:
+        return None
+
+    if update_existing:
+        return statement.on_conflict_do_update(
+            index_elements=[Ticket.ticket_number],
+            set_={
+                **{field: statement.excluded[field] for field in UPSERT_FIELDS},
+                "updated_at": func.now(),
+                "version": Ticket.version + 1
+            }
+        )
+    return statement.on_conflict_do_nothing(index_elements=[Ticket.ticket_number])
+
+
+async def import_tickets(
+    db: AsyncSession,
+    rows: Iterator[tuple[int, Optional[dict], Optional[str]]],
+    created_by_id: str,
+    update_existing: bool = False,
+    batch_size: int = IMPORT_BATCH_SIZE
+) -> TicketImportResponse:
+    """
+    Validate and insert tickets from a row iterator in batches.
+
+    Args:
+        db: Database session
+        rows: Iterator from iter_csv_rows() or iter_ndjson_rows()
+        created_by_id: ID of the importing user
+        update_existing: Update tickets whose ticket_number already exists
+            instead of reporting them as duplicates
+        batch_size: Rows per INSERT/transaction
+
+    Returns:
+        TicketImportResponse with counts and per-row errors
+    """
+    report = TicketImportResponse()
+    seen_numbers = set()
+    statement = _upsert_statement(db.bind.dialect.name, update_existing)
+
+    # Batches are committed as they go, so even if a later batch fails the
+    # tickets already imported must show up in stats and cached responses
+    try:
+        while True:
+            # Reading the upload is blocking file IO, keep it off the event loop
+            batch = await run_in_threadpool(_next_batch, rows, batch_size)
+            if not batch:
+                break
+
+            valid = []
+            for row_number, row, error in batch:
+                report.total_rows += 1
+
+                if error is not None:
+                    report.errors.append(TicketImportError(row=row_number, error=error))
+                    continue
+
+                try:
+                    ticket_data = TicketCreate(**row)
+                except ValidationError as e:
+                    report.errors.append(TicketImportError(
+                        row=row_number,
+                        ticket_number=row.get("ticket_number"),
+                        error="; ".join(
+                            f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+                            for err in e.errors()
+                        )
+                    ))
+                    continue
+
+                if ticket_data.ticket_number in seen_numbers:
+                    report.errors.append(TicketImportError(
+                        row=row_number,
+                        ticket_number=ticket_data.ticket_number,
+                        error="Duplicate ticket number in file"
+                    ))
+                    continue
+
+                seen_numbers.add(ticket_data.ticket_number)
+                valid.append((row_number, ticket_data))
+
+            if not valid:
+                continue
+
+            # One set-based duplicate check for the whole batch, including
+            # archived tickets like create does
+            numbers = [ticket_data.ticket_number for _, ticket_data in valid]
+            result = await db.execute(
+                select(Ticket.ticket_number, literal(False).label("archived"))
+                .filter(Ticket.ticket_number.in_(numbers))
+                .union_all(
+                    select(TicketArchive.ticket_number, literal(True).label("archived"))
+                    .filter(TicketArchive.ticket_number.in_(numbers))
+                )
+            )
+            existing_numbers = set()
+            archived_numbers = set()
+            for ticket_number, archived in result:
+                (archived_numbers if archived else existing_numbers).add(ticket_number)
+
+            values = []
+            created = updated = 0
+            for row_number, ticket_data in valid:
+                if ticket_data.ticket_number in archived_numbers:
+                    # The upsert only sees live tickets; renew it to bring it back
+                    report.skipped += 1
+                    report.errors.append(TicketImportError(
+                        row=row_number,
+                        ticket_number=ticket_data.ticket_number,
+                        error="Ticket number belongs to an archived ticket"
+                    ))
+                    continue
+
+                exists = ticket_data.ticket_number in existing_numbers
+                if exists and not update_existing:
+                    report.skipped += 1
+                    report.errors.append(TicketImportError(
+                        row=row_number,
+                        ticket_number=ticket_data.ticket_number,
+                        error="Ticket number already exists"
+                    ))
+                    continue
+
+                expiration_date = calculate_ticket_expiration(
+                    ticket_data.submit_date,
+                    ticket_data.state,
+                    ticket_data.expiration_date
+                )
+                values.append({
+                    **ticket_data.model_dump(exclude={"expiration_date"}),
+                    "expiration_date": expiration_date,
+                    "status": determine_status(expiration_date),
+                    "created_by_id": created_by_id
+                })
+                if exists:
+                    updated += 1
+                else:
+                    created += 1
+
+            if values:
+                if statement is not None:
+                    await db.execute(statement, values)
+                else:
+                    await db.execute(Ticket.__table__.insert(), values)
+                await db.commit()
+                report.created += created
+                report.updated += updated
+    finally:
+        if report.created or report.updated:
+            invalidate_ticket_stats()
+            await invalidate_ticket_responses()
+            event_hub.publish("imported", {"created": report.created, "updated": report.updated})
+
+    report.errors.sort(key=lambda error: error.row)
+    return report
@@ -2,25 +2,39 @@
 Notification service for sending daily expiration reminders.
 """
 
+import time
 from datetime import date
 from collections import defaultdict
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.ticket_service import get_expiring_tickets
-from app.services.email_service import send_expiration_reminder
+from app.services.email_service import render_expiration_reminder
+from app.services.outbox_service import enqueue_email, notify_outbox
 from app.config import settings
 
 
-async def send_daily_reminders(db: Session):
+async def send_daily_reminders(db: AsyncSession, read_db: Optional[AsyncSession] = None):
     """
     Send daily expiration reminder emails to assigned PMs.
     This function is called by the scheduler every day.
 
+    The emails are queued in the outbox in one transaction and delivered
+    by the outbox worker.
+
     Args:
         db: Database session
+        read_db: Session for the expiring tickets query, e.g. on the read
+            replica (default: db)
+
+    Returns:
+        Run summary (tickets, recipients, seconds), or None if there was
+        nothing to send
     """
+    started = time.perf_counter()
+
     try:
         # Get all expiring tickets
-        expiring_tickets = get_expiring_tickets(db)
+        expiring_tickets = await get_expiring_tickets(read_db or db)
 
         if not expiring_tickets:
             print("No expiring tickets found")
@@ -44,7 +58,7 @@ async def send_daily_reminders(db: Session):
 
             tickets_by_pm[pm].append(ticket_data)
 
-        # Send email to each PM
+        # Queue one email per PM, the outbox worker sends them
         for pm, tickets in tickets_by_pm.items():
             if pm == "Unassigned":
                 # Send to admin if no PM assigned
@@ -55,17 +69,25 @@ async def send_daily_reminders(db: Session):
                 recipient = pm
                 pm_name = pm.split("@")[0].replace(".", " ").title()
 
-            try:
-                await send_expiration_reminder(
-                    tickets=tickets,
-                    recipient=recipient,
-                    pm_name=pm_name
-                )
-                print(f"Sent reminder to {recipient} for {len(tickets)} tickets")
-            except Exception as e:
-                print(f"Error sending reminder to {recipient}: {e}")
+            subject, html_body = render_expiration_reminder(tickets=tickets, pm_name=pm_name)
+            enqueue_email(db, to=recipient, subject=subject, html_body=html_body)
+
+        await db.commit()
+        notify_outbox()
+
+        elapsed = time.perf_counter() - started
+        print(
+            f"Daily reminders queued for {len(expiring_tickets)} tickets to {len(tickets_by_pm)} recipients "
+            f"in {elapsed:.2f}s"
+        )
 
-        print(f"Daily reminders sent for {len(expiring_tickets)} tickets to {len(tickets_by_pm)} recipients")
+        return {
+            "tickets": len(expiring_tickets),
+            "recipients": len(tickets_by_pm),
+            "seconds": round(elapsed, 3)
+        }
 
     except Exception as e:
+        await db.rollback()
         print(f"Error in send_daily_reminders: {e}")
+        raise
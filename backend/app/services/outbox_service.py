@@ -0,0 +1,185 @@
+"""
+Durable email outbox.
+
+Emails are written to the email_outbox table in the caller's transaction and
+delivered later by the outbox worker (app/tasks/outbox_worker.py), so request
+handlers and scheduled jobs never wait on the email API and queued emails
+survive API outages and restarts.
+
+Delivery is at-least-once: a worker claims a batch by leasing it for
+OUTBOX_LEASE_SECONDS, so emails claimed by a worker that died mid-batch are
+picked up again once the lease runs out. Each claim makes a single send
+attempt, so an email is never still being sent when its lease runs out.
+Failed deliveries are retried with exponential backoff (longer if the API
+sent Retry-After), and after OUTBOX_MAX_ATTEMPTS an email is dead-lettered
+(status "dead") and kept with its last error for inspection.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.email_outbox import EmailOutbox
+from app.services.email_service import EmailSendError, send_email
+from app.config import settings
+
+_wakeup: Optional[asyncio.Event] = None
+
+
+def get_wakeup_event() -> asyncio.Event:
+    """
+    Get the event the outbox worker waits on between polls.
+    """
+    global _wakeup
+    if _wakeup is None:
+        _wakeup = asyncio.Event()
+    return _wakeup
+
+
+def notify_outbox():
+    """
+    Wake the outbox worker so newly committed emails go out without waiting
+    for the next poll.
+    """
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+def enqueue_email(db: AsyncSession, to: str, subject: str, html_body: str) -> EmailOutbox:
+    """
+    Queue an email for delivery.
+
+    The email is added to the session only; it is queued when the caller
+    commits. Call notify_outbox() after the commit to send it right away.
+
+    Args:
+        db: Database session
+        to: Recipient email address
+        subject: Email subject
+        html_body: HTML content of the email
+
+    Returns:
+        The pending EmailOutbox row
+    """
+    email = EmailOutbox(
+        recipient=to,
+        subject=subject,
+        html_body=html_body,
+        status="pending",
+        attempts=0,
+        next_attempt_at=datetime.utcnow()
+    )
+    db.add(email)
+    return email
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=settings.OUTBOX_RETRY_BACKOFF_SECONDS * (2 ** (attempts - 1)))
+
+
+async def claim_due_emails(db: AsyncSession, batch_size: int) -> list[EmailOutbox]:
+    """
+    Claim a batch of due emails by leasing them to this worker.
+
+    Due emails are pending ones whose next attempt time has passed, and
+    claimed ones whose lease ran out. On PostgreSQL, rows locked by another
+    worker's claim are skipped.
+
+    Args:
+        db: Database session
+        batch_size: Most emails to claim
+
+    Returns:
+        Claimed EmailOutbox rows, with attempts already counted
+    """
+    now = datetime.utcnow()
+
+    result = await db.execute(
+        select(EmailOutbox)
+        .filter(
+            EmailOutbox.status.in_(("pending", "sending")),
+            EmailOutbox.next_attempt_at <= now
+        )
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    emails = result.scalars().all()
+
+    lease_expires_at = now + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS)
+    for email in emails:
+        email.status = "sending"
+        email.attempts += 1
+        email.next_attempt_at = lease_expires_at
+
+    await db.commit()
+    return emails
+
+
+async def deliver_due_emails(db: AsyncSession, batch_size: Optional[int] = None) -> dict:
+    """
+    Claim one batch of due emails and send it.
+
+    Emails are sent concurrently, at most EMAIL_MAX_CONCURRENCY at a time,
+    and the outcome of the whole batch is written back in one commit.
+
+    Args:
+        db: Database session
+        batch_size: Most emails to send (default OUTBOX_BATCH_SIZE)
+
+    Returns:
+        Batch summary (claimed, sent, retrying, dead, seconds)
+    """
+    started = time.perf_counter()
+    emails = await claim_due_emails(db, batch_size or settings.OUTBOX_BATCH_SIZE)
+
+    summary = {"claimed": len(emails), "sent": 0, "retrying": 0, "dead": 0, "seconds": 0.0}
+    if not emails:
+        return summary
+
+    semaphore = asyncio.Semaphore(settings.EMAIL_MAX_CONCURRENCY)
+
+    async def deliver(email: EmailOutbox) -> Optional[Exception]:
+        async with semaphore:
+            try:
+                # Retrying in place could outlast the lease; failures are
+                # retried by a later claim instead
+                await send_email(to=email.recipient, subject=email.subject, html_body=email.html_body, max_retries=0)
+                return None
+            except Exception as e:
+                return e
+
+    errors = await asyncio.gather(*(deliver(email) for email in emails))
+
+    now = datetime.utcnow()
+    for email, exception in zip(emails, errors):
+        error = None if exception is None else (str(exception) or exception.__class__.__name__)
+        if error is None:
+            email.status = "sent"
+            email.sent_at = now
+            email.last_error = None
+            summary["sent"] += 1
+        elif email.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            email.status = "dead"
+            email.last_error = error
+            summary["dead"] += 1
+            print(f"❌ Email to {email.recipient} dead-lettered after {email.attempts} attempts: {error}")
+        else:
+            delay = _retry_delay(email.attempts)
+            if isinstance(exception, EmailSendError) and exception.retry_after is not None:
+                delay = max(delay, timedelta(seconds=exception.retry_after))
+            email.status = "pending"
+            email.next_attempt_at = now + delay
+            email.last_error = error
+            summary["retrying"] += 1
+
+    await db.commit()
+
+    summary["seconds"] = round(time.perf_counter() - started, 3)
+    print(
+        f"Outbox batch: {summary['sent']} sent, {summary['retrying']} retrying, "
+        f"{summary['dead']} dead in {summary['seconds']:.2f}s"
+    )
+    return summary
@@ -0,0 +1,74 @@
+"""
+Read-your-writes marks for the read replica.
+
+A user who changes something reads from the primary until
+READ_REPLICA_LAG_SECONDS after the change, so they see it even if the
+replica hasn't caught up. get_current_user marks the user when an
+authenticated write request starts, and RecentWriterMiddleware marks them
+again once its response is sent, so the window covers the commit however
+long the request took.
+
+With RESPONSE_CACHE_URL set, marks are kept on that server, so every
+worker routes the user's next read to the primary whichever worker made
+the change. Otherwise they are kept in this process, which only works
+with a single worker. Nothing is marked unless DATABASE_READ_URL is set.
+"""
+
+from app.config import settings
+from app.utils.cache import create_cache_backend
+
+# Marks are tiny and short-lived; the in-process store is sized so a burst
+# of writers can't evict a mark before it expires
+MAX_MARKS = 100_000
+
+_backend = None
+
+
+def _get_backend():
+    global _backend
+    if _backend is None:
+        _backend = create_cache_backend(settings.RESPONSE_CACHE_URL, MAX_MARKS, settings.READ_REPLICA_LAG_SECONDS)
+    return _backend
+
+
+async def mark_recent_writer(user_id: str):
+    """
+    Send a user's reads to the primary for the next READ_REPLICA_LAG_SECONDS.
+    """
+    if settings.DATABASE_READ_URL:
+        await _get_backend().set(f"writers:{user_id}", b"1", settings.READ_REPLICA_LAG_SECONDS)
+
+
+async def is_recent_writer(user_id: str) -> bool:
+    """
+    Check whether a user made a change within READ_REPLICA_LAG_SECONDS.
+    """
+    if not settings.DATABASE_READ_URL:
+        return False
+    return await _get_backend().get(f"writers:{user_id}") is not None
+
+
+async def close_recent_writes():
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
+
+
+class RecentWriterMiddleware:
+    """
+    ASGI middleware renewing the writer mark of an authenticated write
+    request (scope state "writer_id", set by get_current_user) once its
+    response has been sent.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            writer_id = scope.get("state", {}).get("writer_id")
+            if writer_id is not None:
+                await mark_recent_writer(writer_id)
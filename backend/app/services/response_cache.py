@@ -0,0 +1,122 @@
+"""
+Response cache for the ticket list and stats endpoints.
+
+Serialized responses are cached with their ETag, keyed by the endpoint and
+its normalised parameters, so a dashboard view many users load within
+seconds is queried and serialized once. Every ticket (or user) write bumps
+a generation counter that is part of the key, which invalidates all
+entries at once; stale entries are never read again and expire after
+RESPONSE_CACHE_TTL_SECONDS.
+
+With RESPONSE_CACHE_URL set, entries and the generation live on a
+Redis-compatible server and are shared by every worker. Otherwise they are
+kept in this process, and writes made by other processes are only picked
+up when entries expire.
+
+Responses read from a replica shortly after an invalidation may not have
+the write yet, so they are not cached until READ_REPLICA_LAG_SECONDS
+have passed.
+"""
+
+import hashlib
+import json
+import time
+from typing import Optional
+from app.config import settings
+from app.utils.cache import create_cache_backend
+
+GENERATION_KEY = "responses:generation"
+
+_backend = None
+
+# When this process last invalidated the cache (time.monotonic())
+_invalidated_at = float("-inf")
+
+
+def get_response_cache():
+    """
+    Get the response cache backend, creating it on first use.
+    """
+    global _backend
+    if _backend is None:
+        _backend = create_cache_backend(
+            settings.RESPONSE_CACHE_URL,
+            settings.RESPONSE_CACHE_MAX_SIZE,
+            settings.RESPONSE_CACHE_TTL_SECONDS
+        )
+    return _backend
+
+
+async def close_response_cache():
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
+
+
+def response_cache_stats() -> dict:
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return {"backend": "disabled"}
+    return get_response_cache().stats()
+
+
+def _cache_key(generation: int, endpoint: str, params: dict) -> str:
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+    return f"responses:{generation}:{endpoint}:{digest[:32]}"
+
+
+async def get_cached_response(endpoint: str, params: dict) -> tuple[Optional[str], Optional[bytes], Optional[str]]:
+    """
+    Look up a cached response.
+
+    Args:
+        endpoint: Endpoint name, e.g. "list_tickets"
+        params: Normalised request parameters
+
+    Returns:
+        (etag, body, key): etag and body are None on a miss; pass key to
+        cache_response() to store the response under the generation read here
+    """
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return None, None, None
+
+    backend = get_response_cache()
+    key = _cache_key(await backend.get_counter(GENERATION_KEY), endpoint, params)
+
+    value = await backend.get(key)
+    if value is None:
+        return None, None, key
+
+    etag, body = value.split(b"\n", 1)
+    return etag.decode(), body, key
+
+
+async def cache_response(key: Optional[str], etag: str, body: bytes, from_replica: bool = False):
+    """
+    Store a response under a key from get_cached_response().
+
+    A write made while the response was being built has already moved the
+    generation on, so the entry is stored but never read.
+
+    Args:
+        key: Key from get_cached_response()
+        etag: Response ETag
+        body: Serialized response
+        from_replica: The response was read from the read replica
+    """
+    if key is None:
+        return
+    if from_replica and time.monotonic() - _invalidated_at < settings.READ_REPLICA_LAG_SECONDS:
+        return
+    await get_response_cache().set(key, etag.encode() + b"\n" + body, settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+async def invalidate_ticket_responses():
+    """
+    Invalidate every cached response after tickets or users change.
+    """
+    global _invalidated_at
+    _invalidated_at = time.monotonic()
+
+    if settings.RESPONSE_CACHE_ENABLED:
+        await get_response_cache().incr(GENERATION_KEY)
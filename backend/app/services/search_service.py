@@ -0,0 +1,188 @@
+"""
+Indexed ticket search over ticket_number, job_name and address.
+
+SQLite uses an FTS5 table (tickets_fts) kept in sync with tickets by
+triggers. PostgreSQL uses GIN expression indexes: a 'simple' tsvector for
+ranked prefix matching and, when pg_trgm is available, a trigram index so
+substring matches are indexed too. Both are maintained by the database, so
+no application code has to touch the index when tickets change.
+
+If the index has not been created (create_search_index was not run) search
+falls back to the original ILIKE filters.
+"""
+
+import re
+from sqlalchemy import column, func, literal_column, or_, table
+from sqlalchemy.engine import Connection
+from app.models.ticket import Ticket
+
+# Search index state, set by create_search_index()
+_fts_ready = False
+_trigram_ready = False
+
+tickets_fts = table("tickets_fts", column("rowid"), column("rank"))
+
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tickets_fts USING fts5(
+        ticket_number, job_name, address,
+        content='tickets', content_rowid='rowid',
+        tokenize='unicode61', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_insert AFTER INSERT ON tickets BEGIN
+        INSERT INTO tickets_fts(rowid, ticket_number, job_name, address)
+        VALUES (new.rowid, new.ticket_number, new.job_name, new.address);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_delete AFTER DELETE ON tickets BEGIN
+        INSERT INTO tickets_fts(tickets_fts, rowid, ticket_number, job_name, address)
+        VALUES ('delete', old.rowid, old.ticket_number, old.job_name, old.address);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_update
+    AFTER UPDATE OF ticket_number, job_name, address ON tickets BEGIN
+        INSERT INTO tickets_fts(tickets_fts, rowid, ticket_number, job_name, address)
+        VALUES ('delete', old.rowid, old.ticket_number, old.job_name, old.address);
+        INSERT INTO tickets_fts(rowid, ticket_number, job_name, address)
+        VALUES (new.rowid, new.ticket_number, new.job_name, new.address);
+    END
+    """,
+]
+
+POSTGRES_DOCUMENT_SQL = "(ticket_number || ' ' || job_name || ' ' || address)"
+
+POSTGRES_TSVECTOR_DDL = f"""
+    CREATE INDEX IF NOT EXISTS ix_tickets_search_tsv ON tickets
+    USING gin (to_tsvector('simple'::regconfig, {POSTGRES_DOCUMENT_SQL}))
+"""
+
+POSTGRES_TRIGRAM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"""
+    CREATE INDEX IF NOT EXISTS ix_tickets_search_trgm ON tickets
+    USING gin ({POSTGRES_DOCUMENT_SQL} gin_trgm_ops)
+    """,
+]
+
+
+def create_search_index(connection: Connection):
+    """
+    Create the search index for the connection's database if missing.
+
+    On SQLite the FTS table is populated from existing tickets when it is
+    first created. It is keyed on tickets.rowid, so run
+    rebuild_search_index() after a VACUUM (which may renumber rowids).
+
+    Args:
+        connection: Sync database connection (inside a transaction)
+    """
+    global _fts_ready, _trigram_ready
+    dialect = connection.dialect.name
+
+    if dialect == "sqlite":
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tickets_fts'"
+        ).first()
+        try:
+            for ddl in SQLITE_SEARCH_DDL:
+                connection.exec_driver_sql(ddl)
+        except Exception as e:
+            print(f"⚠️  FTS5 unavailable, search will use LIKE: {e}")
+            return
+        if not exists:
+            rebuild_search_index(connection)
+        _fts_ready = True
+
+    elif dialect == "postgresql":
+        connection.exec_driver_sql(POSTGRES_TSVECTOR_DDL)
+        _fts_ready = True
+        try:
+            with connection.begin_nested():
+                for ddl in POSTGRES_TRIGRAM_DDL:
+                    connection.exec_driver_sql(ddl)
+            _trigram_ready = True
+        except Exception as e:
+            print(f"⚠️  pg_trgm unavailable, substring search is not indexed: {e}")
+
+
+def rebuild_search_index(connection: Connection):
+    """
+    Rebuild the SQLite FTS table from the tickets table.
+
+    Args:
+        connection: Sync database connection (inside a transaction)
+    """
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("INSERT INTO tickets_fts(tickets_fts) VALUES ('rebuild')")
+
+
+def _search_terms(search: str) -> list[str]:
+    return re.findall(r"\w+", search)
+
+
+def _sqlite_match_query(terms: list[str]) -> str:
+    # Every term must match the start of a token: "foo"* AND "bar"*
+    return " AND ".join(f'"{term}"*' for term in terms)
+
+
+def _postgres_tsquery(terms: list[str]) -> str:
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def _postgres_document():
+    space = literal_column("' '")
+    return Ticket.ticket_number + space + Ticket.job_name + space + Ticket.address
+
+
+def apply_search(query, search: str, dialect_name: str):
+    """
+    Filter a select() over Ticket to tickets matching a search string.
+
+    Args:
+        query: select() statement over the tickets table
+        search: Search text from the user
+        dialect_name: Database dialect the query will run on
+
+    Returns:
+        Tuple of (filtered query, ORDER BY clause ranking best matches first)
+    """
+    terms = _search_terms(search)
+
+    if _fts_ready and terms and dialect_name == "sqlite":
+        query = query.join(
+            tickets_fts, tickets_fts.c.rowid == literal_column("tickets.rowid")
+        ).filter(literal_column("tickets_fts").op("MATCH")(_sqlite_match_query(terms)))
+        # FTS5 rank is bm25(), where lower is better
+        return query, tickets_fts.c.rank.asc()
+
+    if _fts_ready and terms and dialect_name == "postgresql":
+        document = _postgres_document()
+        vector = func.to_tsvector(literal_column("'simple'::regconfig"), document)
+        tsquery = func.to_tsquery(literal_column("'simple'::regconfig"), _postgres_tsquery(terms))
+        matches = vector.op("@@")(tsquery)
+        rank = func.ts_rank(vector, tsquery)
+
+        if _trigram_ready:
+            matches = or_(matches, document.ilike(f"%{search}%"))
+            rank = rank + func.similarity(document, search)
+
+        return query.filter(matches), rank.desc()
+
+    return query.filter(search_filter(Ticket, search)), Ticket.expiration_date.asc()
+
+
+def search_filter(model, search: str):
+    """
+    Unindexed ILIKE filter matching a search string, for Ticket or
+    TicketArchive (which has no search index).
+    """
+    search_pattern = f"%{search}%"
+    return or_(
+        model.ticket_number.ilike(search_pattern),
+        model.job_name.ilike(search_pattern),
+        model.address.ilike(search_pattern)
+    )
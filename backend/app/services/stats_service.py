@@ -0,0 +1,209 @@
+"""
+Ticket statistics service.
+
+Statistics are computed with a single grouped query and kept in an
+in-process summary that ticket writes update incrementally, so the
+dashboard's /tickets/stats call is normally a dictionary read.
+"""
+
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional
+from sqlalchemy import select, func, case
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import is_replica_session
+from app.models.ticket import Ticket
+from app.schemas.ticket import TicketStats
+from app.config import settings
+
+STATUSES = ("active", "expiring_soon", "expired", "renewed")
+
+# Days ahead counted by TicketStats.expiring_in_next_7_days
+EXPIRING_WINDOW_DAYS = 7
+
+
+class TicketStatsSummary:
+    """
+    Ticket counts by status and state, plus the 7-day expiration window.
+    """
+
+    def __init__(self, as_of: date):
+        self.as_of = as_of
+        self.status_counts = {status: 0 for status in STATUSES}
+        self.state_counts = {}
+        self.expiring_in_next_7_days = 0
+        self.computed_at = datetime.utcnow()
+        self.updated_at = self.computed_at
+        # tickets table version the counts were computed at, None once
+        # changed incrementally (the version after a change isn't known,
+        # so the next read that knows the current version recomputes)
+        self.tickets_version: Optional[int] = None
+
+    def add(self, state: str, status: str, expiration_date: Optional[date], count: int = 1):
+        """
+        Add (or with a negative count, remove) tickets from the summary.
+        """
+        self.status_counts[status] = self.status_counts.get(status, 0) + count
+
+        self.state_counts[state] = self.state_counts.get(state, 0) + count
+        if self.state_counts[state] <= 0:
+            del self.state_counts[state]
+
+        window_end = self.as_of + timedelta(days=EXPIRING_WINDOW_DAYS)
+        if expiration_date is not None and self.as_of <= expiration_date <= window_end:
+            self.expiring_in_next_7_days += count
+
+    def to_schema(self) -> TicketStats:
+        return TicketStats(
+            total_tickets=sum(self.state_counts.values()),
+            active_tickets=self.status_counts.get("active", 0),
+            expiring_soon_tickets=self.status_counts.get("expiring_soon", 0),
+            expired_tickets=self.status_counts.get("expired", 0),
+            renewed_tickets=self.status_counts.get("renewed", 0),
+            tickets_by_state=dict(self.state_counts),
+            expiring_in_next_7_days=self.expiring_in_next_7_days,
+            computed_at=self.computed_at,
+            updated_at=self.updated_at
+        )
+
+
+_summary: Optional[TicketStatsSummary] = None
+_generation = 0
+_changed_at = float("-inf")  # time.monotonic() of the last recorded change
+
+
+def ticket_snapshot(ticket: Ticket) -> tuple:
+    """
+    Capture the fields of a ticket that the statistics depend on.
+
+    Args:
+        ticket: Ticket object
+
+    Returns:
+        Tuple of (state, status, expiration_date)
+    """
+    return (ticket.state, ticket.status, ticket.expiration_date)
+
+
+def record_ticket_change(before: Optional[tuple] = None, after: Optional[tuple] = None):
+    """
+    Apply a committed ticket change to the cached summary.
+
+    Args:
+        before: ticket_snapshot() before the change (None for a create)
+        after: ticket_snapshot() after the change (None for a delete)
+    """
+    global _generation, _changed_at
+    _generation += 1
+    _changed_at = time.monotonic()
+
+    if _summary is None:
+        return
+
+    if before is not None:
+        _summary.add(*before, count=-1)
+    if after is not None:
+        _summary.add(*after, count=1)
+    _summary.updated_at = datetime.utcnow()
+    _summary.tickets_version = None
+
+
+def invalidate_ticket_stats():
+    """
+    Drop the cached summary so the next read recomputes it.
+    """
+    global _summary, _generation, _changed_at
+    _generation += 1
+    _changed_at = time.monotonic()
+    _summary = None
+
+
+async def compute_ticket_stats(db: AsyncSession) -> TicketStatsSummary:
+    """
+    Compute ticket statistics in a single grouped query.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Freshly computed TicketStatsSummary
+    """
+    today = date.today()
+    window_end = today + timedelta(days=EXPIRING_WINDOW_DAYS)
+
+    result = await db.execute(
+        select(
+            Ticket.state,
+            Ticket.status,
+            func.count(Ticket.id),
+            func.sum(case((Ticket.expiration_date.between(today, window_end), 1), else_=0))
+        ).group_by(Ticket.state, Ticket.status)
+    )
+
+    summary = TicketStatsSummary(as_of=today)
+    for state, status, count, expiring_count in result.all():
+        summary.add(state, status, None, count=count)
+        summary.expiring_in_next_7_days += expiring_count or 0
+
+    return summary
+
+
+async def refresh_ticket_stats(db: AsyncSession, tickets_version: Optional[int] = None) -> TicketStatsSummary:
+    """
+    Recompute the cached summary from the database.
+
+    If a ticket change is recorded while the query is running, the result
+    is not cached since it may or may not include that change. Neither is
+    a result read from the replica within READ_REPLICA_LAG_SECONDS of a change.
+
+    Args:
+        db: Database session
+        tickets_version: tickets table version read before the query, if known
+
+    Returns:
+        Freshly computed TicketStatsSummary
+    """
+    global _summary
+    generation = _generation
+
+    summary = await compute_ticket_stats(db)
+    summary.tickets_version = tickets_version
+
+    replica_may_lag = (
+        is_replica_session(db) and time.monotonic() - _changed_at < settings.READ_REPLICA_LAG_SECONDS
+    )
+    if generation == _generation and not replica_may_lag:
+        _summary = summary
+
+    return summary
+
+
+async def get_ticket_stats(db: AsyncSession, tickets_version: Optional[int] = None) -> TicketStats:
+    """
+    Get ticket statistics, recomputing them only when the cache is stale.
+
+    The cache is stale when it was computed on an earlier day (the 7-day
+    window has moved) or more than STATS_MAX_AGE_SECONDS ago, or, given
+    tickets_version, when it doesn't match the version the cache was
+    computed at: tickets changed since, here or in another worker.
+
+    Args:
+        db: Database session
+        tickets_version: Current tickets table version, if known
+
+    Returns:
+        TicketStats response
+    """
+    summary = _summary
+    max_age = timedelta(seconds=settings.STATS_MAX_AGE_SECONDS)
+
+    if (
+        summary is None
+        or summary.as_of != date.today()
+        or datetime.utcnow() - summary.computed_at > max_age
+        # None after a local change, whose resulting version isn't known
+        or (tickets_version is not None and tickets_version != summary.tickets_version)
+    ):
+        summary = await refresh_ticket_stats(db, tickets_version)
+
+    return summary.to_schema()
@@ -2,13 +2,26 @@
 Ticket service for business logic and status updates.
 """
 
+import uuid
+from collections import Counter
 from datetime import date, timedelta
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update, case, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.job_watermark import JobWatermark
 from app.models.ticket import Ticket
+from app.services.event_hub import publish_ticket_batch
+from app.services.response_cache import invalidate_ticket_responses
+from app.services.stats_service import refresh_ticket_stats
 from app.utils.expiration import calculate_expiration, determine_status, is_expiring_soon, is_expired
 from app.config import settings
 
+# job_watermarks row holding the last date update_ticket_statuses processed
+STATUS_WATERMARK = "ticket_statuses"
+
+# Transitions listed individually in the job's log
+STATUS_LOG_LIMIT = 50
+
 
 def calculate_ticket_expiration(submit_date: date, state: str, manual_override: Optional[date] = None) -> date:
     """
@@ -28,46 +41,212 @@ def calculate_ticket_expiration(submit_date: date, state: str, manual_override:
     return calculate_expiration(submit_date, state)
 
 
-async def update_ticket_statuses(db: Session):
+def ticket_status_case(today: date, threshold: date):
+    """
+    SQL CASE giving the status a ticket's expiration date calls for,
+    matching determine_status().
+    """
+    return case(
+        (Ticket.expiration_date < today, "expired"),
+        (Ticket.expiration_date <= threshold, "expiring_soon"),
+        else_="active"
+    )
+
+
+def current_status_expression():
+    """
+    SQL expression for the status each ticket's expiration date calls for
+    today, for set-based writes that change the status.
+    """
+    today = date.today()
+    return ticket_status_case(today, today + timedelta(days=settings.EXPIRATION_WARNING_DAYS))
+
+
+def status_transition_statement(today: date, warning_days: int, since: Optional[date] = None):
+    """
+    Build the UPDATE that moves tickets to the status their expiration date
+    calls for, returning the tickets that changed.
+
+    Statuses only change when the date crosses a ticket's expiration date
+    or the start of its warning window, so with a since date only tickets
+    whose boundary fell between since and today are considered, plus
+    renewed tickets, which settle to active or expiring soon on the next run.
+    Ticket writes never leave any other status out of line with the
+    expiration date (see the update routes), so nothing else can be missed.
+
+    Args:
+        today: Current date
+        warning_days: Days before expiration that count as expiring soon
+        since: Last date already processed, or None to check every ticket
+
+    Returns:
+        UPDATE ... RETURNING id, ticket_number, status
+    """
+    threshold = today + timedelta(days=warning_days)
+    new_status = ticket_status_case(today, threshold)
+
+    statement = update(Ticket).where(Ticket.status != new_status)
+
+    if since is not None:
+        since_threshold = since + timedelta(days=warning_days)
+        statement = statement.where(or_(
+            # Expired since the last run
+            and_(Ticket.expiration_date >= since, Ticket.expiration_date < today),
+            # Entered the warning window since the last run
+            and_(Ticket.expiration_date > since_threshold, Ticket.expiration_date <= threshold),
+            Ticket.status == "renewed"
+        ))
+
+    return (
+        statement
+        .values(status=new_status)
+        .returning(Ticket.id, Ticket.ticket_number, Ticket.status)
+    )
+
+
+def normalise_ticket_id(ticket_id: str) -> str:
+    """
+    Get the canonical form of a ticket id (lowercase, hyphenated), or the
+    id unchanged if it is not a valid UUID.
+    """
+    try:
+        return str(uuid.UUID(ticket_id))
+    except ValueError:
+        return ticket_id
+
+
+def valid_ticket_ids(ids: list[str]) -> list[str]:
+    """
+    Normalise ticket ids, dropping those that are not valid UUIDs (they
+    can't match a ticket, and PostgreSQL rejects them in a comparison).
+    """
+    valid_ids = []
+    for ticket_id in ids:
+        try:
+            valid_ids.append(str(uuid.UUID(ticket_id)))
+        except ValueError:
+            pass
+    return valid_ids
+
+
+async def bulk_update_tickets(
+    db: AsyncSession,
+    values: dict,
+    ids: Optional[list[str]] = None,
+    filters: Optional[dict] = None
+) -> list:
     """
-    Update the status of all tickets based on their expiration dates.
+    Apply the same change to many tickets in one set-based UPDATE.
+
+    The caller commits. updated_at and version are bumped by the UPDATE
+    itself, like any other ticket write.
+
+    Args:
+        db: Database session
+        values: Column values to set
+        ids: Ticket ids to change (ids that are not valid UUIDs match nothing)
+        filters: Or column values the tickets to change must have, e.g.
+            {"assigned_pm": "pm@example.com", "status": "expiring_soon"}
+
+    Returns:
+        Changed tickets (id, ticket_number, status, expiration_date)
+    """
+    statement = update(Ticket).values(**values)
+
+    if ids is not None:
+        valid_ids = valid_ticket_ids(ids)
+        if not valid_ids:
+            return []
+        statement = statement.where(Ticket.id.in_(valid_ids))
+    else:
+        for column, value in filters.items():
+            statement = statement.where(getattr(Ticket, column) == value)
+
+    result = await db.execute(
+        statement
+        .returning(Ticket.id, Ticket.ticket_number, Ticket.status, Ticket.expiration_date)
+        .execution_options(synchronize_session=False)
+    )
+    return result.all()
+
+
+async def update_ticket_statuses(db: AsyncSession, full: bool = False) -> list[dict]:
+    """
+    Update ticket statuses for the days passed since the last run.
     This function is called periodically by the scheduler.
 
+    The last processed date is kept in the job_watermarks table and moves
+    forward in the same transaction as the update. The first run, or a run
+    with full=True (e.g. after changing EXPIRATION_WARNING_DAYS), checks
+    every ticket.
+
     Args:
         db: Database session
+        full: Check every ticket instead of only the window since the last run
+
+    Returns:
+        Tickets that changed status (id, ticket_number, status)
     """
     try:
         today = date.today()
-        threshold = today + timedelta(days=settings.EXPIRATION_WARNING_DAYS)
-
-        # Update expired tickets
-        expired_count = db.query(Ticket).filter(
-            Ticket.expiration_date < today,
-            Ticket.status != "expired"
-        ).update({"status": "expired"}, synchronize_session=False)
-
-        # Update expiring soon tickets
-        expiring_count = db.query(Ticket).filter(
-            Ticket.expiration_date >= today,
-            Ticket.expiration_date <= threshold,
-            Ticket.status.in_(["active", "renewed"])
-        ).update({"status": "expiring_soon"}, synchronize_session=False)
-
-        # Update active tickets (those with more than threshold days remaining)
-        active_count = db.query(Ticket).filter(
-            Ticket.expiration_date > threshold,
-            Ticket.status != "active"
-        ).update({"status": "active"}, synchronize_session=False)
-
-        db.commit()
-        print(f"Status update complete: {expired_count} expired, {expiring_count} expiring soon, {active_count} active")
+
+        watermark = await db.get(JobWatermark, STATUS_WATERMARK)
+        since = None
+        if watermark is not None and not full and watermark.value <= today:
+            since = watermark.value
+
+        result = await db.execute(
+            status_transition_statement(today, settings.EXPIRATION_WARNING_DAYS, since)
+            .execution_options(synchronize_session=False)
+        )
+        transitions = [
+            {"id": str(row.id), "ticket_number": row.ticket_number, "status": row.status}
+            for row in result
+        ]
+
+        if watermark is None:
+            db.add(JobWatermark(name=STATUS_WATERMARK, value=today))
+        else:
+            watermark.value = today
+
+        await db.commit()
+
+        if transitions:
+            await refresh_ticket_stats(db)
+            await invalidate_ticket_responses()
+            publish_ticket_batch("status_changed", transitions)
+
+        counts = Counter(transition["status"] for transition in transitions)
+        window = "all tickets" if since is None else f"since {since.isoformat()}"
+        print(
+            f"Status update complete ({window}): {counts['expired']} expired, "
+            f"{counts['expiring_soon']} expiring soon, {counts['active']} active"
+        )
+        for transition in transitions[:STATUS_LOG_LIMIT]:
+            print(f"  {transition['ticket_number']} -> {transition['status']}")
+        if len(transitions) > STATUS_LOG_LIMIT:
+            print(f"  ... and {len(transitions) - STATUS_LOG_LIMIT} more")
+
+        return transitions
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"Error updating ticket statuses: {e}")
+        raise
+
+
+def expiring_tickets_query(today: date, threshold_date: date):
+    """
+    Select open tickets expiring between today and threshold_date.
+    """
+    return select(Ticket).filter(
+        Ticket.expiration_date >= today,
+        Ticket.expiration_date <= threshold_date,
+        Ticket.status.in_(["active", "expiring_soon"])
+    )
 
 
-def get_expiring_tickets(db: Session, days_threshold: int = None) -> list[Ticket]:
+async def get_expiring_tickets(db: AsyncSession, days_threshold: int = None) -> list[Ticket]:
     """
     Get tickets that are expiring soon.
 
@@ -84,8 +263,5 @@ def get_expiring_tickets(db: Session, days_threshold: int = None) -> list[Ticket
     today = date.today()
     threshold_date = today + timedelta(days=days_threshold)
 
-    return db.query(Ticket).filter(
-        Ticket.expiration_date >= today,
-        Ticket.expiration_date <= threshold_date,
-        Ticket.status.in_(["active", "expiring_soon"])
-    ).all()
+    result = await db.execute(expiring_tickets_query(today, threshold_date))
+    return list(result.scalars().all())
@@ -0,0 +1,66 @@
+"""
+Background worker that drains the email outbox.
+"""
+
+import asyncio
+from typing import Optional
+from app.services.outbox_service import deliver_due_emails, get_wakeup_event
+from app.database import AsyncSessionLocal
+from app.config import settings
+
+_worker_task: Optional[asyncio.Task] = None
+
+
+async def run_outbox_worker():
+    """
+    Deliver due emails batch by batch, then wait for a wakeup or the next poll.
+    """
+    wakeup = get_wakeup_event()
+
+    while True:
+        # Cleared before the pass so emails queued during it wake the next one
+        wakeup.clear()
+
+        try:
+            async with AsyncSessionLocal() as db:
+                summary = await deliver_due_emails(db)
+        except Exception as e:
+            print(f"Error in outbox worker: {e}")
+            summary = None
+
+        if summary and summary["claimed"] >= settings.OUTBOX_BATCH_SIZE:
+            # A full batch, more are probably due
+            continue
+
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=settings.OUTBOX_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+def start_outbox_worker():
+    """
+    Start the outbox worker on the running event loop.
+    """
+    global _worker_task
+    _worker_task = asyncio.create_task(run_outbox_worker())
+    print("✓ Email outbox worker started")
+
+
+async def shutdown_outbox_worker():
+    """
+    Stop the outbox worker.
+
+    Emails claimed by an interrupted batch are retried once their lease expires.
+    """
+    global _worker_task
+    if _worker_task is None:
+        return
+
+    _worker_task.cancel()
+    try:
+        await _worker_task
+    except asyncio.CancelledError:
+        pass
+    _worker_task = None
+    print("✓ Email outbox worker stopped")
@@ -4,9 +4,12 @@ Background scheduler for periodic tasks.
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from app.services.archive_service import archive_expired_tickets
+from app.services.auth_service import purge_magic_links
 from app.services.notification_service import send_daily_reminders
 from app.services.ticket_service import update_ticket_statuses
-from app.database import SessionLocal
+from app.database import AsyncSessionLocal, ReadSessionLocal
+from app.utils.metrics import track_job
 from app.config import settings
 
 scheduler = AsyncIOScheduler()
@@ -38,6 +41,29 @@ def start_scheduler():
         replace_existing=True
     )
 
+    # Delete used and expired magic links hourly
+    scheduler.add_job(
+        func=run_magic_link_purge,
+        trigger=CronTrigger(minute=45),
+        id="purge_magic_links",
+        name="Purge used and expired magic links",
+        replace_existing=True
+    )
+
+    # Archive long-expired tickets daily, outside working hours
+    if settings.ARCHIVE_RETENTION_DAYS > 0:
+        scheduler.add_job(
+            func=run_archive,
+            trigger=CronTrigger(
+                hour=settings.ARCHIVE_HOUR,
+                minute=30,
+                timezone=settings.NOTIFICATION_TIMEZONE
+            ),
+            id="archive_expired_tickets",
+            name="Archive long-expired tickets",
+            replace_existing=True
+        )
+
     scheduler.start()
     print("✓ Background scheduler started")
 
@@ -54,19 +80,34 @@ async def run_daily_reminders():
     """
     Wrapper function to run daily reminders with database session.
     """
-    db = SessionLocal()
-    try:
-        await send_daily_reminders(db)
-    finally:
-        db.close()
+    async with (
+        track_job("daily_expiration_reminders") as run,
+        AsyncSessionLocal() as db,
+        ReadSessionLocal() as read_db
+    ):
+        summary = await send_daily_reminders(db, read_db)
+        run.rows = summary["tickets"] if summary else 0
 
 
 async def run_status_updates():
     """
     Wrapper function to run status updates with database session.
     """
-    db = SessionLocal()
-    try:
-        await update_ticket_statuses(db)
-    finally:
-        db.close()
+    async with track_job("update_ticket_statuses") as run, AsyncSessionLocal() as db:
+        run.rows = len(await update_ticket_statuses(db))
+
+
+async def run_archive():
+    """
+    Wrapper function to run the ticket archive with database session.
+    """
+    async with track_job("archive_expired_tickets") as run, AsyncSessionLocal() as db:
+        run.rows = len(await archive_expired_tickets(db))
+
+
+async def run_magic_link_purge():
+    """
+    Wrapper function to run the magic link purge with database session.
+    """
+    async with track_job("purge_magic_links") as run, AsyncSessionLocal() as db:
+        run.rows = await purge_magic_links(db)
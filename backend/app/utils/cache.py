@@ -0,0 +1,187 @@
+"""
+Caching utilities: an in-process TTL/LRU cache, and response cache
+backends that keep entries in this process or in a Redis-compatible
+server shared by several workers.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a time-to-live.
+
+    When full, the least recently used entry is evicted. Hit and miss
+    counts are kept so the hit rate can be reported.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a value, or default if it is missing or expired.
+        """
+        entry = self._entries.get(key)
+
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        """
+        Store a value, expiring after ttl_seconds (default: the cache TTL).
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0 or self.max_size <= 0:
+            return
+
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Get cache size and hit-rate counters.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class MemoryCacheBackend:
+    """
+    Response cache backend keeping entries and counters in this process.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.cache = TTLCache(max_size, ttl_seconds)
+        self.counters: dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float):
+        self.cache.set(key, value, ttl_seconds)
+
+    async def get_counter(self, key: str) -> int:
+        return self.counters.get(key, 0)
+
+    async def incr(self, key: str) -> int:
+        self.counters[key] = self.counters.get(key, 0) + 1
+        return self.counters[key]
+
+    async def close(self):
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        return {"backend": self.name, **self.cache.stats()}
+
+
+class RedisCacheBackend:
+    """
+    Response cache backend on a Redis-compatible server (Redis, Valkey,
+    KeyDB, ...), so every worker shares entries and invalidations.
+
+    Server errors are logged and treated as cache misses: the API keeps
+    working, uncached, while the server is down.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, key_prefix: str = "811:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise RuntimeError("RESPONSE_CACHE_URL needs the redis package: pip install redis")
+
+        self.client = redis.from_url(url)
+        self.key_prefix = key_prefix
+        self.errors = (redis.RedisError, OSError)
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            value = await self.client.get(self.key_prefix + key)
+        except self.errors as e:
+            print(f"⚠️  Response cache unavailable: {e}")
+            return None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float):
+        try:
+            await self.client.set(self.key_prefix + key, value, px=int(ttl_seconds * 1000))
+        except self.errors as e:
+            print(f"⚠️  Response cache unavailable: {e}")
+
+    async def get_counter(self, key: str) -> int:
+        try:
+            return int(await self.client.get(self.key_prefix + key) or 0)
+        except self.errors as e:
+            print(f"⚠️  Response cache unavailable: {e}")
+            return 0
+
+    async def incr(self, key: str) -> int:
+        try:
+            return await self.client.incr(self.key_prefix + key)
+        except self.errors as e:
+            print(f"⚠️  Response cache unavailable: {e}")
+            return 0
+
+    async def close(self):
+        await self.client.aclose()
+
+    def stats(self) -> dict:
+        return {"backend": self.name, "hits": self.hits, "misses": self.misses}
+
+
+def create_cache_backend(url: str, max_size: int, ttl_seconds: float):
+    """
+    Create the response cache backend for a URL.
+
+    Args:
+        url: redis:// or rediss:// URL, or empty for an in-process cache
+        max_size: Entries kept by the in-process cache
+        ttl_seconds: Default time-to-live of the in-process cache
+
+    Returns:
+        MemoryCacheBackend or RedisCacheBackend
+    """
+    if not url:
+        return MemoryCacheBackend(max_size, ttl_seconds)
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCacheBackend(url)
+    raise ValueError(f"Unsupported response cache URL: {url}")
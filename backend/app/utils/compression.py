@@ -0,0 +1,132 @@
+"""
+Content negotiation and compression for serialized responses.
+
+Endpoints that build their body as bytes (the ticket list) pick the
+representation from the Accept header and compress bodies of at least
+RESPONSE_COMPRESSION_MIN_BYTES with the best Accept-Encoding the client
+allows: brotli when it is installed (pip install brotli), else gzip.
+Bodies are cached uncompressed and compressed per response, so one cache
+entry serves every encoding.
+"""
+
+import gzip
+from typing import Optional
+from app.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Vary header for responses negotiated on Accept and Accept-Encoding
+VARY = "Accept, Accept-Encoding"
+
+
+def parse_accept(header: Optional[str]) -> dict[str, float]:
+    """
+    Parse an Accept or Accept-Encoding header.
+
+    Args:
+        header: Header value, e.g. "br;q=1.0, gzip;q=0.8, *;q=0.1"
+
+    Returns:
+        Dict of lowercased media type or coding to its quality
+    """
+    accepted = {}
+    for item in (header or "").split(","):
+        value, *params = [part.strip() for part in item.split(";")]
+        if not value:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, number = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(number)
+                except ValueError:
+                    quality = 0.0
+        accepted[value.lower()] = quality
+    return accepted
+
+
+def prefers(header: Optional[str], values: tuple[str, ...], default: str) -> bool:
+    """
+    Check whether an Accept header prefers one of values to the default
+    media type.
+
+    The values must be listed explicitly, while the default is also
+    accepted through type/* and */* (or an absent header). On equal
+    quality the explicitly listed values win.
+
+    Args:
+        header: The request's Accept header
+        values: Media types of the alternative, e.g. MessagePack's names
+        default: Media type sent otherwise, e.g. "application/json"
+
+    Returns:
+        True to send the alternative
+    """
+    accepted = parse_accept(header)
+    quality = max(accepted.get(value, 0) for value in values)
+    if quality <= 0:
+        return False
+
+    default_quality = max(
+        accepted.get(default, 0),
+        accepted.get(f"{default.split('/')[0]}/*", 0),
+        accepted.get("*/*", 0)
+    )
+    return quality >= default_quality
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the content coding for a response.
+
+    Args:
+        accept_encoding: The request's Accept-Encoding header
+
+    Returns:
+        "br", "gzip", or None to send the body as is
+    """
+    if not settings.RESPONSE_COMPRESSION_ENABLED:
+        return None
+
+    accepted = parse_accept(accept_encoding)
+    best, best_quality = None, 0.0
+    # Highest quality wins, brotli on a tie
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        quality = accepted.get(encoding, accepted.get("*", 0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """
+    Give each content coding of a representation its own strong ETag.
+    """
+    if encoding is None:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def compress_body(body: bytes, encoding: Optional[str]) -> tuple[bytes, Optional[str]]:
+    """
+    Compress a body with a coding from negotiate_encoding().
+
+    Args:
+        body: Serialized response
+        encoding: "br", "gzip" or None
+
+    Returns:
+        (body, Content-Encoding or None if sent uncompressed)
+    """
+    if encoding is None or len(body) < settings.RESPONSE_COMPRESSION_MIN_BYTES:
+        return body, None
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.RESPONSE_COMPRESSION_BROTLI_QUALITY), "br"
+    # mtime=0 keeps the output the same for the same body
+    return gzip.compress(body, compresslevel=settings.RESPONSE_COMPRESSION_GZIP_LEVEL, mtime=0), "gzip"
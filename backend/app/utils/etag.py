@@ -0,0 +1,98 @@
+"""
+ETag and conditional GET utilities.
+
+Read endpoints build a strong ETag from version numbers that change
+whenever their response would (tickets.version, the table_versions
+counters), checked with a primary key lookup before the real query runs.
+If the client's If-None-Match has it, the endpoint answers 304 Not
+Modified without querying or serializing anything else.
+"""
+
+import hashlib
+from typing import Any
+from fastapi import Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.table_version import TableVersion
+
+# Browsers keep the response but revalidate it on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values that determine a response.
+
+    Args:
+        parts: Endpoint name, versions, query string, ...
+
+    Returns:
+        Quoted ETag header value
+    """
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match lists the ETag (or is *).
+
+    If-None-Match uses weak comparison, so a W/ prefix is ignored.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def set_etag(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def etag_response(body: bytes, etag: str, media_type: str = "application/json") -> Response:
+    """
+    Build a response from an already serialized (JSON by default) body.
+    """
+    return Response(
+        content=body, media_type=media_type,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Build the 304 Not Modified response for a matching ETag.
+    """
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def table_version(name: str):
+    """
+    Scalar subquery for a table's change counter, to check it alongside a row.
+    """
+    return select(TableVersion.version).filter(TableVersion.name == name).scalar_subquery()
+
+
+async def get_table_versions(db: AsyncSession, *names: str) -> dict[str, int]:
+    """
+    Get the change counters of tables in one query.
+
+    Args:
+        db: Database session
+        names: Table names
+
+    Returns:
+        Dict of table name to version (0 if the table has no counter)
+    """
+    result = await db.execute(
+        select(TableVersion.name, TableVersion.version).filter(TableVersion.name.in_(names))
+    )
+    versions = {name: 0 for name in names}
+    versions.update(result.tuples().all())
+    return versions
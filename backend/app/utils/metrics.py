@@ -0,0 +1,239 @@
+"""
+Prometheus metrics for the API, database and scheduled jobs.
+
+Exposed in the Prometheus text format at /metrics:
+- http_request_duration_seconds, http_requests_total and
+  http_requests_in_progress per route template
+- http_request_sql_statements and http_request_sql_seconds: SQL statement
+  count and time spent in SQL per request, per route
+- db_statement_duration_seconds for every statement
+- db_pool_* connection pool checkouts, in-use connections and, for
+  queue pools, size and overflow
+- scheduler_job_* duration, outcome and rows for the scheduled jobs
+"""
+
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional
+from prometheus_client import Counter, Gauge, Histogram, REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from starlette.routing import Match
+from app.utils.sql_timing import add_statement_observer, time_statements
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ["method", "route"]
+)
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests", ["method", "route", "status"]
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests being handled", ["method", "route"]
+)
+HTTP_REQUEST_SQL_STATEMENTS = Histogram(
+    "http_request_sql_statements", "SQL statements executed per request", ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100)
+)
+HTTP_REQUEST_SQL_SECONDS = Histogram(
+    "http_request_sql_seconds", "Time spent executing SQL per request", ["method", "route"]
+)
+
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds", "SQL statement execution time",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+DB_POOL_CHECKOUTS = Counter(
+    "db_pool_checkouts_total", "Connections checked out of the pool", ["engine"]
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently checked out", ["engine"]
+)
+
+SCHEDULER_JOB_DURATION = Histogram(
+    "scheduler_job_duration_seconds", "Scheduled job run time", ["job"],
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+)
+SCHEDULER_JOB_RUNS = Counter(
+    "scheduler_job_runs_total", "Scheduled job runs", ["job", "outcome"]
+)
+SCHEDULER_JOB_ROWS = Counter(
+    "scheduler_job_rows_total", "Rows processed by scheduled jobs", ["job"]
+)
+SCHEDULER_JOB_LAST_ROWS = Gauge(
+    "scheduler_job_last_rows", "Rows processed by the last successful run", ["job"]
+)
+SCHEDULER_JOB_LAST_SUCCESS = Gauge(
+    "scheduler_job_last_success_timestamp_seconds", "Unix time of the last successful run", ["job"]
+)
+
+
+class RequestSQLStats:
+    """
+    SQL statement count and time for the request being handled.
+    """
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+
+_request_sql: ContextVar[Optional[RequestSQLStats]] = ContextVar("request_sql", default=None)
+
+
+def _observe_statement(statement: str, elapsed: float):
+    DB_STATEMENT_DURATION.observe(elapsed)
+
+    stats = _request_sql.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += elapsed
+
+
+def instrument_engine(engine, name: str):
+    """
+    Record statement timings and pool usage for an engine.
+
+    Args:
+        engine: Sync engine (use async_engine.sync_engine for the async one)
+        name: Value of the engine label on pool metrics
+    """
+    add_statement_observer(_observe_statement)
+    time_statements(engine)
+
+    checkouts = DB_POOL_CHECKOUTS.labels(name)
+    checked_out = DB_POOL_CHECKED_OUT.labels(name)
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        checkouts.inc()
+        checked_out.inc()
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        checked_out.dec()
+
+    _pool_collector.engines[name] = engine
+
+
+class PoolCollector:
+    """
+    Reports pool size and overflow for engines with a queue pool.
+    """
+
+    def __init__(self):
+        self.engines = {}
+
+    def collect(self):
+        size = GaugeMetricFamily("db_pool_size", "Connections the pool keeps open", labels=["engine"])
+        overflow = GaugeMetricFamily(
+            "db_pool_overflow", "Connections open beyond the pool size (negative: spare capacity)",
+            labels=["engine"]
+        )
+
+        for name, engine in self.engines.items():
+            pool = engine.pool
+            if hasattr(pool, "overflow"):
+                size.add_metric([name], pool.size())
+                overflow.add_metric([name], pool.overflow())
+
+        yield size
+        yield overflow
+
+
+_pool_collector = PoolCollector()
+REGISTRY.register(_pool_collector)
+
+
+def _route_template(scope) -> str:
+    """
+    Get the route path template for a request, e.g. /api/v1/tickets/{ticket_id},
+    so metrics are labelled per route rather than per URL.
+    """
+    app = scope.get("app")
+    router = getattr(app, "router", None)
+    for route in getattr(router, "routes", []):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status, in-flight count and SQL
+    usage per route. Streaming responses are timed until the last chunk.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = _route_template(scope)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestSQLStats()
+        token = _request_sql.set(stats)
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method, route)
+        in_progress.inc()
+        start = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.labels(method, route).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+            HTTP_REQUEST_SQL_STATEMENTS.labels(method, route).observe(stats.statements)
+            HTTP_REQUEST_SQL_SECONDS.labels(method, route).observe(stats.seconds)
+            in_progress.dec()
+            _request_sql.reset(token)
+
+
+class JobRun:
+    """
+    Handle for a tracked job run; set rows to the number of rows processed.
+    """
+
+    def __init__(self):
+        self.rows: Optional[int] = None
+
+
+@asynccontextmanager
+async def track_job(job: str):
+    """
+    Record the duration, outcome and row count of a scheduled job run.
+
+    Example:
+        async with track_job("update_ticket_statuses") as run:
+            run.rows = len(await update_ticket_statuses(db))
+
+    Args:
+        job: Scheduler job id
+    """
+    run = JobRun()
+    start = time.perf_counter()
+
+    try:
+        yield run
+    except Exception:
+        SCHEDULER_JOB_RUNS.labels(job, "failure").inc()
+        raise
+    else:
+        SCHEDULER_JOB_RUNS.labels(job, "success").inc()
+        SCHEDULER_JOB_LAST_SUCCESS.labels(job).set_to_current_time()
+        if run.rows is not None:
+            SCHEDULER_JOB_ROWS.labels(job).inc(run.rows)
+            SCHEDULER_JOB_LAST_ROWS.labels(job).set(run.rows)
+    finally:
+        SCHEDULER_JOB_DURATION.labels(job).observe(time.perf_counter() - start)
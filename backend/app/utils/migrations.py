@@ -0,0 +1,52 @@
+"""
+Apply Alembic migrations on application startup.
+"""
+
+import os
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Databases created by Base.metadata.create_all before migrations existed
+# have no alembic_version table. They are stamped at the newest revision
+# whose table they already have, checked in this order.
+UNVERSIONED_BASELINES = [
+    ("email_outbox", "0002"),
+    ("tickets", "0001")
+]
+
+
+def get_alembic_config() -> Config:
+    """
+    Get the Alembic config for alembic.ini, independent of the working directory.
+    """
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def upgrade_database(engine: Engine):
+    """
+    Upgrade the database to the latest migration.
+
+    Args:
+        engine: Sync engine to migrate
+    """
+    config = get_alembic_config()
+
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        tables = set(inspect(connection).get_table_names())
+
+        if "alembic_version" not in tables:
+            for table, revision in UNVERSIONED_BASELINES:
+                if table in tables:
+                    command.stamp(config, revision)
+                    print(f"✓ Existing database stamped at migration {revision}")
+                    break
+
+        command.upgrade(config, "head")
@@ -0,0 +1,127 @@
+"""
+Keyset (cursor) pagination utilities.
+
+A cursor records the sort value and id of the last row on a page, so the
+next page can be fetched with a WHERE clause on the sort index instead of
+an OFFSET that has to walk past every earlier row.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any
+from sqlalchemy import Date, DateTime, String, and_, literal, or_
+
+
+def encode_cursor(sort_by: str, sort_order: str, value: Any, last_id: Any) -> str:
+    """
+    Encode the position after a row into an opaque cursor string.
+
+    Args:
+        sort_by: Name of the column the page is sorted on
+        sort_order: "asc" or "desc"
+        value: The row's value for the sort column
+        last_id: The row's id (tiebreaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+
+    payload = {"s": sort_by, "o": sort_order, "v": value, "id": str(last_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column, sort_order: str, dialect_name: str = "") -> tuple[Any, str]:
+    """
+    Decode a cursor and check it belongs to the requested sort.
+
+    Args:
+        cursor: Cursor string from a previous page's next_cursor
+        sort_column: Column the current request sorts on
+        sort_order: "asc" or "desc"
+        dialect_name: Database dialect the value will be compared on
+
+    Returns:
+        Tuple of (sort value, last id)
+
+    Raises:
+        ValueError: Cursor is malformed or was issued for a different sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort_by, order, value, last_id = payload["s"], payload["o"], payload["v"], payload["id"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Malformed cursor")
+
+    if sort_by != sort_column.key or order != sort_order:
+        raise ValueError("Cursor does not match the requested sort")
+
+    if value is not None:
+        if isinstance(sort_column.type, DateTime):
+            value = datetime.fromisoformat(value)
+            if dialect_name == "sqlite" and not value.microsecond:
+                # SQLite compares datetimes as text, and server_default=func.now()
+                # stores them without the fractional part SQLAlchemy binds with
+                value = literal(value.strftime("%Y-%m-%d %H:%M:%S"), String)
+        elif isinstance(sort_column.type, Date):
+            value = date.fromisoformat(value)
+
+    return value, last_id
+
+
+def keyset_filter(sort_column, id_column, value: Any, last_id: str, descending: bool = False):
+    """
+    Build the WHERE clause selecting rows after a cursor position.
+
+    Rows are ordered by (sort_column, id_column) with NULL sort values last,
+    matching the ORDER BY built by keyset_order_by.
+
+    Args:
+        sort_column: Column the page is sorted on
+        id_column: Unique tiebreaker column
+        value: Sort value of the last row on the previous page
+        last_id: Id of the last row on the previous page
+        descending: True if sorting in descending order
+
+    Returns:
+        SQLAlchemy boolean clause
+    """
+    id_after = id_column < last_id if descending else id_column > last_id
+
+    if value is None:
+        return and_(sort_column.is_(None), id_after)
+
+    value_after = sort_column < value if descending else sort_column > value
+    clause = or_(value_after, and_(sort_column == value, id_after))
+
+    if sort_column.nullable:
+        clause = or_(clause, sort_column.is_(None))
+
+    return clause
+
+
+def keyset_order_by(sort_column, id_column, descending: bool = False) -> list:
+    """
+    Build a deterministic ORDER BY for keyset pagination.
+
+    Args:
+        sort_column: Column to sort on
+        id_column: Unique tiebreaker column
+        descending: True to sort in descending order
+
+    Returns:
+        List of ORDER BY clauses
+    """
+    if descending:
+        order = [sort_column.desc(), id_column.desc()]
+    else:
+        order = [sort_column.asc(), id_column.asc()]
+
+    if sort_column.nullable:
+        order[0] = order[0].nulls_last()
+
+    return order
@@ -0,0 +1,72 @@
+"""
+SQL statement counting for catching N+1 query regressions.
+
+Example:
+    with assert_max_queries(async_engine, 2):
+        client.get("/api/v1/tickets")
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryCounter:
+    """
+    Records every SQL statement executed on an engine while active.
+    """
+
+    def __init__(self):
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(engine: Engine | AsyncEngine) -> Iterator[QueryCounter]:
+    """
+    Count the SQL statements executed on an engine inside the block.
+
+    Args:
+        engine: Sync or async engine to watch
+
+    Yields:
+        QueryCounter collecting the statements
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    counter = QueryCounter()
+
+    event.listen(sync_engine, "before_cursor_execute", counter._before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", counter._before_cursor_execute)
+
+
+@contextmanager
+def assert_max_queries(engine: Engine | AsyncEngine, max_queries: int) -> Iterator[QueryCounter]:
+    """
+    Fail if more than max_queries SQL statements run inside the block.
+
+    Args:
+        engine: Sync or async engine to watch
+        max_queries: Highest allowed statement count
+
+    Raises:
+        AssertionError: Listing the executed statements when over the limit
+    """
+    with count_queries(engine) as counter:
+        yield counter
+
+    if counter.count > max_queries:
+        listing = "\n".join(f"  {i}. {sql}" for i, sql in enumerate(counter.statements, start=1))
+        raise AssertionError(
+            f"Expected at most {max_queries} SQL statements, got {counter.count}:\n{listing}"
+        )
@@ -1,8 +1,13 @@
 """
-Security utilities for JWT token handling.
+Security utilities for JWT token handling and signed magic links.
 """
 
+import base64
+import calendar
+import hashlib
+import hmac
 import jwt
+import secrets
 from datetime import datetime, timedelta
 from typing import Optional
 from app.config import settings
@@ -49,3 +54,57 @@ def decode_access_token(token: str) -> dict:
         jwt.InvalidTokenError: Token is invalid
     """
     return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+
+def _magic_link_signature(message: str) -> str:
+    # Keyed per purpose, so a magic link signature is never valid elsewhere
+    key = hmac.new(settings.SECRET_KEY.encode(), b"magic-link", hashlib.sha256).digest()
+    digest = hmac.new(key, message.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def create_magic_link_token(user_id: str, expires_at: datetime) -> str:
+    """
+    Create a signed magic link token.
+
+    The token carries the user id, its expiration and a random nonce, and
+    is valid until it expires without being stored anywhere.
+
+    Args:
+        user_id: User's unique identifier
+        expires_at: Expiration time (UTC)
+
+    Returns:
+        Token string: user_id.expires.nonce.signature
+    """
+    message = f"{user_id}.{calendar.timegm(expires_at.utctimetuple())}.{secrets.token_urlsafe(16)}"
+    return f"{message}.{_magic_link_signature(message)}"
+
+
+def decode_magic_link_token(token: str) -> Optional[tuple[str, str, datetime]]:
+    """
+    Check a signed magic link token's signature and expiration.
+
+    Args:
+        token: Token from create_magic_link_token()
+
+    Returns:
+        (user_id, nonce, expires_at) if the token is authentic and unexpired,
+        None otherwise
+    """
+    parts = token.split(".")
+    if len(parts) != 4:
+        return None
+
+    user_id, expires, nonce, signature = parts
+    if not hmac.compare_digest(signature, _magic_link_signature(f"{user_id}.{expires}.{nonce}")):
+        return None
+
+    try:
+        expires_at = datetime.utcfromtimestamp(int(expires))
+    except (ValueError, OverflowError, OSError):
+        return None
+    if datetime.utcnow() > expires_at:
+        return None
+
+    return user_id, nonce, expires_at
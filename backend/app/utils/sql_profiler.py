@@ -0,0 +1,181 @@
+"""
+Per-request SQL profiling (opt-in with SQL_PROFILING_ENABLED).
+
+For every request it records the statement count, total database time and
+the slowest statements, and returns them as Server-Timing headers, e.g.
+
+    Server-Timing: db;dur=41.2;desc="12 statements", db-1;dur=30.5;desc="SELECT tickets.id, ...",
+                   db-repeated-1;dur=8.1;desc="10x SELECT users.id, ..."
+
+so they show up in the browser's network panel. Statements slower than
+SQL_SLOW_QUERY_MS are written to the slow-query log, as are statements a
+single request runs SQL_REPEATED_STATEMENT_THRESHOLD or more times (the
+N+1 pattern: the same SQL with different parameters, once per row).
+
+Statements run after the response headers are sent (streamed bodies) are
+logged but not included in the headers.
+"""
+
+import logging
+import sys
+from contextvars import ContextVar
+from typing import Optional
+from app.config import settings
+from app.utils.sql_timing import add_statement_observer, time_statements
+
+slow_query_log = logging.getLogger("app.slow_queries")
+
+# Server-Timing descriptions are quoted strings, keep them short
+DESCRIPTION_LENGTH = 80
+
+
+class StatementStats:
+    """
+    Executions and time of one SQL statement within a request.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+
+
+class RequestProfile:
+    """
+    SQL statements run while handling one request.
+    """
+
+    def __init__(self, label: str):
+        self.label = label
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: dict[str, StatementStats] = {}
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+
+        stats = self.statements.get(statement)
+        if stats is None:
+            stats = self.statements[statement] = StatementStats()
+        stats.count += 1
+        stats.seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+
+    def slowest(self, limit: int) -> list[tuple[str, StatementStats]]:
+        return sorted(self.statements.items(), key=lambda item: item[1].max_seconds, reverse=True)[:limit]
+
+    def repeated(self, threshold: int) -> list[tuple[str, StatementStats]]:
+        return sorted(
+            ((statement, stats) for statement, stats in self.statements.items() if stats.count >= threshold),
+            key=lambda item: item[1].count, reverse=True
+        )
+
+    def server_timing(self) -> str:
+        """
+        Build the Server-Timing header value for this profile.
+        """
+        entries = [f'db;dur={self.seconds * 1000:.1f};desc="{self.count} statements"']
+
+        for i, (statement, stats) in enumerate(self.slowest(settings.SQL_PROFILE_TOP_STATEMENTS), start=1):
+            entries.append(f'db-{i};dur={stats.max_seconds * 1000:.1f};desc="{_describe(statement)}"')
+
+        repeated = self.repeated(settings.SQL_REPEATED_STATEMENT_THRESHOLD)
+        for i, (statement, stats) in enumerate(repeated, start=1):
+            entries.append(
+                f'db-repeated-{i};dur={stats.seconds * 1000:.1f};desc="{stats.count}x {_describe(statement)}"'
+            )
+
+        return ", ".join(entries)
+
+
+_request_profile: ContextVar[Optional[RequestProfile]] = ContextVar("request_profile", default=None)
+
+
+def _describe(statement: str) -> str:
+    """
+    Squash a statement onto one line, without quotes, for a header.
+    """
+    text = " ".join(statement.split()).replace('"', "'").replace("\\", "")
+    if len(text) > DESCRIPTION_LENGTH:
+        text = text[:DESCRIPTION_LENGTH - 3] + "..."
+    return text
+
+
+def _observe_statement(statement: str, elapsed: float):
+    profile = _request_profile.get()
+    if profile is not None:
+        profile.record(statement, elapsed)
+
+    if elapsed * 1000 >= settings.SQL_SLOW_QUERY_MS:
+        slow_query_log.warning(
+            "slow query %.1fms [%s]: %s",
+            elapsed * 1000, profile.label if profile else "background", " ".join(statement.split())
+        )
+
+
+def configure_slow_query_log():
+    """
+    Send the slow-query log to SQL_SLOW_QUERY_LOG, or stderr if it is empty.
+    """
+    if slow_query_log.handlers:
+        return
+
+    if settings.SQL_SLOW_QUERY_LOG:
+        handler = logging.FileHandler(settings.SQL_SLOW_QUERY_LOG)
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+
+    slow_query_log.addHandler(handler)
+    slow_query_log.setLevel(logging.WARNING)
+    slow_query_log.propagate = False
+
+
+def profile_engine(engine):
+    """
+    Profile every statement run on an engine, sharing the statement
+    timing with the metrics (see utils/sql_timing.py).
+
+    Args:
+        engine: Sync engine (use async_engine.sync_engine for the async one)
+    """
+    add_statement_observer(_observe_statement)
+    time_statements(engine)
+
+
+class SQLProfilingMiddleware:
+    """
+    ASGI middleware adding per-request SQL Server-Timing headers and
+    logging repeated statements.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(f"{scope['method']} {scope['path']}")
+        token = _request_profile.set(profile)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", profile.server_timing().encode("latin-1", "replace")))
+                headers.append((b"timing-allow-origin", b"*"))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_profile.reset(token)
+
+            for statement, stats in profile.repeated(settings.SQL_REPEATED_STATEMENT_THRESHOLD):
+                slow_query_log.warning(
+                    "repeated query %dx, %.1fms total [%s]: %s",
+                    stats.count, stats.seconds * 1000, profile.label, " ".join(statement.split())
+                )
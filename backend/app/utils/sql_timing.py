@@ -0,0 +1,57 @@
+"""
+Shared SQL statement timing.
+
+Each engine gets one before/after_cursor_execute listener pair, however
+many consumers want statement timings (the Prometheus metrics, the
+opt-in SQL profiler), and every statement's duration is passed to the
+registered observers, so a statement is only timed once.
+"""
+
+import time
+from typing import Callable
+from sqlalchemy import event
+
+# Called with (statement, seconds) after every statement on a timed engine
+StatementObserver = Callable[[str, float], None]
+
+_observers: list[StatementObserver] = []
+
+
+def add_statement_observer(observer: StatementObserver):
+    """
+    Call observer(statement, seconds) after every timed statement.
+    Adding the same observer again has no effect.
+    """
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the statement's execution context, which is dropped with it,
+    # so a statement that fails (never reaching after_cursor_execute)
+    # leaves nothing behind on the pooled connection
+    if context is not None:
+        context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_query_start", None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+
+    for observer in _observers:
+        observer(statement, elapsed)
+
+
+def time_statements(engine):
+    """
+    Time every statement run on an engine for the statement observers.
+    Calling it again for the same engine has no effect.
+
+    Args:
+        engine: Sync engine (use async_engine.sync_engine for the async one)
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,125 @@
+"""
+Synthetic ticket dataset for benchmarks.
+
+Tickets are spread across the configured states, a pool of PMs and a
+window of submit dates, with statuses derived from their expiration date
+the same way the app does. Generation is seeded, so the same arguments
+always give the same dataset.
+"""
+
+import random
+import time
+import uuid
+from datetime import date, timedelta
+from typing import Iterator
+
+STREETS = ["Elm", "Oak", "Maple", "Pine", "Cedar", "Main", "Church", "Broad", "Mill", "Lake",
+           "Hill", "Park", "Spring", "River", "Franklin", "Washington", "Jefferson", "Madison"]
+SUFFIXES = ["St", "Ave", "Rd", "Blvd", "Ln", "Dr", "Ct", "Way"]
+CITIES = ["Richmond", "Arlington", "Alexandria", "Baltimore", "Rockville", "Annapolis", "Norfolk"]
+JOB_TYPES = ["Sewer Repair", "Fiber Install", "Gas Main", "Water Service", "Storm Drain",
+             "Pole Replacement", "Paving", "Foundation", "Conduit", "Curb Cut"]
+
+# Share of still-open tickets left as "renewed", as after a renewal
+RENEWED_SHARE = 0.03
+
+LOAD_BATCH_SIZE = 10_000
+
+
+def pm_email(index: int) -> str:
+    return f"pm{index}@example.com"
+
+
+def iter_tickets(count: int, seed: int = 811, pms: int = 50, history_days: int = 60) -> Iterator[dict]:
+    """
+    Yield synthetic ticket rows for bulk insertion.
+
+    Args:
+        count: Number of tickets
+        seed: Random seed
+        pms: Number of distinct assigned PMs (about 1 in 20 tickets is unassigned)
+        history_days: Submit dates are spread over this many days before today
+
+    Yields:
+        Ticket column dicts
+    """
+    from app.utils.expiration import determine_status
+    from app.utils.state_rules import STATE_EXPIRATION_RULES, get_state_expiration_days
+
+    rng = random.Random(seed)
+    today = date.today()
+    states = list(STATE_EXPIRATION_RULES)
+
+    for i in range(count):
+        state = rng.choice(states)
+        submit_date = today - timedelta(days=rng.randint(0, history_days))
+        expiration_date = submit_date + timedelta(days=get_state_expiration_days(state))
+        status = determine_status(expiration_date)
+        if status != "expired" and rng.random() < RENEWED_SHARE:
+            status = "renewed"
+
+        yield {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "ticket_number": f"{today.year}-{i:07d}",
+            "job_name": f"{rng.choice(STREETS)} {rng.choice(JOB_TYPES)}",
+            "address": f"{rng.randint(1, 9999)} {rng.choice(STREETS)} {rng.choice(SUFFIXES)}, {rng.choice(CITIES)}",
+            "state": state,
+            "submit_date": submit_date,
+            "expiration_date": expiration_date,
+            "status": status,
+            "assigned_pm": pm_email(rng.randint(1, pms)) if rng.random() >= 0.05 else None,
+        }
+
+
+def generate_tickets(count: int, seed: int = 811, pms: int = 50, history_days: int = 60) -> list[dict]:
+    """
+    Generate synthetic ticket rows as a list, see iter_tickets().
+    """
+    return list(iter_tickets(count, seed=seed, pms=pms, history_days=history_days))
+
+
+def load_tickets(engine, count: int, seed: int = 811, pms: int = 50, history_days: int = 60) -> float:
+    """
+    Replace the tickets table's rows with a synthetic dataset.
+
+    Rows are inserted with multi-row INSERTs in batches of LOAD_BATCH_SIZE
+    and the search index is built once at the end.
+
+    Args:
+        engine: Sync engine of a migrated database
+        count, seed, pms, history_days: See iter_tickets()
+
+    Returns:
+        Seconds taken
+    """
+    from sqlalchemy import delete, insert
+    from app.models import Ticket
+    from app.services.search_service import create_search_index
+
+    start = time.perf_counter()
+    rows = iter_tickets(count, seed=seed, pms=pms, history_days=history_days)
+
+    with engine.begin() as connection:
+        if connection.dialect.name == "sqlite":
+            # Drop the FTS table and its sync triggers during the load,
+            # create_search_index() rebuilds it in one pass afterwards
+            for trigger in ("tickets_fts_insert", "tickets_fts_delete", "tickets_fts_update"):
+                connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+            connection.exec_driver_sql("DROP TABLE IF EXISTS tickets_fts")
+
+        connection.execute(delete(Ticket.__table__))
+
+        while True:
+            batch = [row for _, row in zip(range(LOAD_BATCH_SIZE), rows)]
+            if not batch:
+                break
+            connection.execute(insert(Ticket.__table__), batch)
+
+        create_search_index(connection)
+
+    with engine.connect() as connection:
+        connection.execution_options(isolation_level="AUTOCOMMIT").exec_driver_sql(
+            "VACUUM ANALYZE tickets" if connection.dialect.name == "postgresql" else "ANALYZE"
+        )
+
+    return time.perf_counter() - start
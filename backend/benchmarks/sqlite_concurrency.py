@@ -0,0 +1,167 @@
+"""
+SQLite read latency while the status job writes, with and without the
+SQLITE_* tuning (WAL, synchronous=NORMAL, busy timeout, cache and mmap).
+
+Loads a synthetic ticket table into a scratch SQLite file, then for each
+profile runs reader threads issuing ticket list queries while a writer
+repeatedly runs the status job's UPDATE, moving thousands of tickets
+between active and expiring_soon. Reports read latency percentiles, reads
+that failed with "database is locked", and writer throughput.
+
+Usage (from the backend directory):
+    python -m benchmarks.sqlite_concurrency
+    python -m benchmarks.sqlite_concurrency --tickets 250000 --seconds 20 --readers 8
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+
+PAGE_SIZE = 50
+
+# The writer alternates between these warning windows, so every UPDATE moves tickets
+WARNING_DAYS = (5, 30)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickets", type=int, default=100_000, help="Number of tickets to load")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Duration of each profile's run")
+    parser.add_argument("--readers", type=int, default=4, help="Concurrent reader threads")
+    return parser.parse_args()
+
+
+def percentile(sorted_timings: list[float], pct: float) -> float:
+    if not sorted_timings:
+        return 0.0
+    return sorted_timings[min(len(sorted_timings) - 1, int(len(sorted_timings) * pct))]
+
+
+def run_profile(url: str, tuned: bool, args) -> dict:
+    """
+    Run readers against a writer for args.seconds on a fresh engine.
+
+    Returns:
+        Read latencies (ms), locked read count, write latencies (ms)
+    """
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.exc import OperationalError
+    from app.config import settings
+    from app.database import configure_sqlite, engine_options
+    from app.models import Ticket
+    from app.services.ticket_service import status_transition_statement
+
+    settings.SQLITE_TUNING_ENABLED = tuned
+    engine = create_engine(url, **engine_options(url))
+    configure_sqlite(engine)
+
+    if not tuned:
+        # WAL is stored in the database file, switch back to SQLite's default
+        with engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA journal_mode = DELETE")
+
+    queries = [
+        select(Ticket).order_by(Ticket.expiration_date, Ticket.id).limit(PAGE_SIZE),
+        select(Ticket).filter(Ticket.status == "expiring_soon")
+        .order_by(Ticket.expiration_date, Ticket.id).limit(PAGE_SIZE),
+    ]
+
+    stop = threading.Event()
+    reads, writes = [], []
+    locked = [0]
+    lock = threading.Lock()
+
+    def reader(index: int):
+        timings, failures = [], 0
+        i = index
+        with engine.connect() as connection:
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    connection.execute(queries[i % len(queries)]).all()
+                    connection.rollback()
+                    timings.append((time.perf_counter() - start) * 1000)
+                except OperationalError:
+                    connection.rollback()
+                    failures += 1
+                i += 1
+        with lock:
+            reads.extend(timings)
+            locked[0] += failures
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                with engine.begin() as connection:
+                    connection.execute(
+                        status_transition_statement(date.today(), WARNING_DAYS[i % len(WARNING_DAYS)])
+                    ).all()
+                writes.append((time.perf_counter() - start) * 1000)
+            except OperationalError:
+                pass
+            i += 1
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    engine.dispose()
+    return {"reads": sorted(reads), "locked": locked[0], "writes": sorted(writes)}
+
+
+def main():
+    args = parse_args()
+
+    scratch_file = os.path.join(tempfile.mkdtemp(), "sqlite_concurrency.db")
+    url = f"sqlite:///{scratch_file}"
+    os.environ["DATABASE_URL"] = url
+
+    # Settings the app requires but the benchmark never uses
+    for name, value in [("SECRET_KEY", "benchmark"), ("SMTP_HOST", "localhost"),
+                        ("SMTP_FROM_EMAIL", "bench@example.com"), ("ADMIN_EMAIL", "bench@example.com")]:
+        os.environ.setdefault(name, value)
+
+    from sqlalchemy import create_engine
+    from app.utils.migrations import upgrade_database
+    from benchmarks.dataset import load_tickets
+
+    engine = create_engine(url)
+    upgrade_database(engine)
+    print(f"Loading {args.tickets:,} tickets into sqlite...")
+    print(f"  loaded and indexed in {load_tickets(engine, args.tickets, history_days=365):.1f}s\n")
+    engine.dispose()
+
+    print(f"{args.readers} readers, 1 writer, {args.seconds:.0f}s per profile\n")
+    print(f"{'profile':<10} {'reads/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>9} "
+          f"{'locked':>7} {'writes':>7} {'write p50':>10}")
+
+    for name, tuned in (("defaults", False), ("tuned", True)):
+        result = run_profile(url, tuned, args)
+        reads, writes = result["reads"], result["writes"]
+        print(
+            f"{name:<10} {len(reads) / args.seconds:>8.0f} "
+            f"{percentile(reads, 0.5):>6.2f}ms {percentile(reads, 0.95):>6.2f}ms "
+            f"{percentile(reads, 0.99):>6.2f}ms {(reads[-1] if reads else 0):>7.1f}ms "
+            f"{result['locked']:>7} {len(writes):>7} "
+            f"{(statistics.median(writes) if writes else 0):>8.1f}ms"
+        )
+
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(scratch_file + suffix):
+            os.remove(scratch_file + suffix)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
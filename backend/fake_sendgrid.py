@@ -0,0 +1,72 @@
+"""
+Fake SendGrid API for local development.
+Accepts mail sends without delivering them, so the email outbox can be
+exercised end to end. Point EMAIL_API_URL at it:
+
+    python fake_sendgrid.py --port 8025 --failure-rate 0.2
+    EMAIL_API_URL=http://localhost:8025/v3/mail/send
+
+GET /messages lists what was received, GET /stats shows the counts.
+"""
+
+import argparse
+import asyncio
+import random
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+options = argparse.Namespace(latency=0.1, failure_rate=0.0)
+messages = []
+stats = {"accepted": 0, "failed": 0}
+
+
+async def send(request: Request):
+    """Accept a SendGrid v3 mail send, failing at random if configured."""
+    await asyncio.sleep(options.latency)
+
+    if random.random() < options.failure_rate:
+        stats["failed"] += 1
+        return Response(
+            "Too many requests",
+            status_code=random.choice([429, 503]),
+            headers={"Retry-After": "1"}
+        )
+
+    data = await request.json()
+    personalization = data["personalizations"][0]
+    messages.append({
+        "to": [recipient["email"] for recipient in personalization["to"]],
+        "subject": personalization["subject"]
+    })
+    stats["accepted"] += 1
+    print(f"📧 {personalization['subject']} -> {messages[-1]['to']}")
+
+    return Response(status_code=202)
+
+
+async def list_messages(request: Request):
+    return JSONResponse(messages)
+
+
+async def get_stats(request: Request):
+    return JSONResponse(stats)
+
+
+app = Starlette(routes=[
+    Route("/v3/mail/send", send, methods=["POST"]),
+    Route("/messages", list_messages),
+    Route("/stats", get_stats)
+])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a fake SendGrid API")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds to wait per request")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of requests answered 429/503")
+    parser.parse_args(namespace=options)
+
+    uvicorn.run(app, host="127.0.0.1", port=options.port)
@@ -5,6 +5,7 @@
 import { BrowserRouter, Routes, Route, Navigate } from 'react-router-dom';
 import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
 import { AuthProvider, useAuth } from './hooks/useAuth';
+import { useTicketEvents } from './hooks/useTickets';
 import Header from './components/Layout/Header';
 import Footer from './components/Layout/Footer';
 import ScrollToTop from './components/Common/ScrollToTop';
@@ -50,6 +51,8 @@ function ProtectedRoute({ children }) {
 
 // Main layout wrapper
 function AppLayout({ children }) {
+  useTicketEvents();
+
   return (
     <div className="min-h-screen bg-gray-50 flex flex-col">
       <Header />
@@ -2,6 +2,7 @@
  * Tickets data hook using React Query
  */
 
+import { useEffect } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { tickets as ticketsAPI } from '../lib/api';
 
@@ -77,3 +78,35 @@ export function useTicketStats() {
     queryFn: () => ticketsAPI.stats(),
   });
 }
+
+/**
+ * Refetch ticket queries when the server reports a change, so other
+ * users' edits and the hourly status job show up without polling.
+ */
+export function useTicketEvents() {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    const source = new EventSource(ticketsAPI.eventsUrl());
+
+    const refetchAll = () => {
+      queryClient.invalidateQueries({ queryKey: ['tickets'] });
+      queryClient.invalidateQueries({ queryKey: ['ticket-stats'] });
+    };
+
+    const refetchTicket = (event) => {
+      refetchAll();
+      queryClient.invalidateQueries({ queryKey: ['ticket', JSON.parse(event.data).id] });
+    };
+
+    const refetchEverything = () => {
+      refetchAll();
+      queryClient.invalidateQueries({ queryKey: ['ticket'] });
+    };
+
+    ['created', 'updated', 'renewed', 'deleted'].forEach((type) => source.addEventListener(type, refetchTicket));
+    ['imported', 'status_changed', 'bulk_renewed', 'bulk_updated', 'archived', 'reset'].forEach((type) => source.addEventListener(type, refetchEverything));
+
+    return () => source.close();
+  }, [queryClient]);
+}
@@ -100,6 +100,11 @@ export const tickets = {
   renew: (id, newExpirationDate) => api.post(`/tickets/${id}/renew`, { new_expiration_date: newExpirationDate }),
   delete: (id) => api.delete(`/tickets/${id}`),
   stats: () => api.get('/tickets/stats'),
+  // EventSource can't send headers, so the token goes in the query string
+  eventsUrl: () => {
+    const token = localStorage.getItem('access_token');
+    return `${API_URL}/tickets/events${token ? '?access_token=' + encodeURIComponent(token) : ''}`;
+  },
 };
 
 export const users = {